@@ -5,42 +5,91 @@ All legacy parameters and imports have been removed.
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import date, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     PollenApiAuthError,
     PollenApiConnectionError,
     PollenApiError,
-    async_get_pollenat_data,
+    PollenApiRateLimitError,
 )
+from .cache import get_response_cache, grid_cell_key
 from .const import (
     CONF_APIKEY,
+    CONF_CACHE_TTL,
     CONF_COUNTRY,
+    CONF_GRID_PRECISION,
     CONF_LANG,
     CONF_LATITUDE,
     CONF_LONGITUDE,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_STARTUP_MODE,
+    DATA_COORDINATORS,
     DEFAULT_APIKEY,
+    DEFAULT_CACHE_TTL,
     DEFAULT_COUNTRY,
+    DEFAULT_GRID_PRECISION,
     DEFAULT_LANG,
     DEFAULT_LATITUDE,
     DEFAULT_LONGITUDE,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STARTUP_MODE,
     DOMAIN,
     PLATFORMS,
+    RESTORE_MAX_AGE,
+    STARTUP_MODE_BACKGROUND,
 )
-from .utils import get_country_code_map
+from .model import PollenForecast, parse_forecast
+from .polling import (
+    OFF_SEASON_INTERVAL,
+    PUBLICATION_SPREAD,
+    RETRY_SPREAD,
+    PublicationSchedule,
+    SeasonTracker,
+    get_refresh_scheduler,
+)
+from .ratelimit import configure_rate_limiter
+from .services import async_setup_services
+from .utils import async_get_language_block, get_country_code_map
 
 DEBUG = True
 _LOGGER = logging.getLogger(__name__)
+# Refresh interval until the publication schedule of a location is known
 SCAN_INTERVAL = timedelta(hours=8)
+# Faster retries after a failed refresh, one step per consecutive failure,
+# before falling back to SCAN_INTERVAL.
+RECOVERY_INTERVALS = (
+    timedelta(minutes=5),
+    timedelta(minutes=15),
+    timedelta(minutes=30),
+    timedelta(hours=1),
+    timedelta(hours=2),
+)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration's services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Initial setup of the integration using config entry."""
+    setup_started = time.monotonic()
 
     # --- MIGRATION: convert country display names to ISO codes ---
 
@@ -65,6 +114,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     country = entry.data.get(CONF_COUNTRY, DEFAULT_COUNTRY)
     lang = entry.data.get(CONF_LANG, DEFAULT_LANG)
     apikey = entry.data.get(CONF_APIKEY, DEFAULT_APIKEY)
+    grid_precision = entry.options.get(CONF_GRID_PRECISION, DEFAULT_GRID_PRECISION)
+    cache_ttl = entry.options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL)
+    startup_mode = entry.options.get(CONF_STARTUP_MODE, DEFAULT_STARTUP_MODE)
+
+    # The limiter is shared by every entry using this API key; the entry set
+    # up last decides its rate and burst.
+    configure_rate_limiter(
+        apikey,
+        entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+    )
 
     if DEBUG:
         _LOGGER.debug(
@@ -75,26 +135,180 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             lang,
         )
 
-    coordinator = PollenInformationDataUpdateCoordinator(
-        hass, lat, lon, country, lang, apikey
+    # Entries with the same fetch parameters share one coordinator
+    coordinator = _async_acquire_coordinator(
+        hass,
+        entry.entry_id,
+        lat,
+        lon,
+        country,
+        lang,
+        apikey,
+        grid_precision=grid_precision,
+        cache_ttl=cache_ttl,
     )
+    shared = coordinator.data is not None
 
-    # First refresh to populate data
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except UpdateFailed as err:
-        _LOGGER.error("Error fetching initial data: %s", err)
-        raise ConfigEntryNotReady
+    # In background mode, entities are created right away from the last stored
+    # payload or, failing that, from the entity registry, and the first fetch
+    # runs in the background. Entries without either must wait for the API.
+    background = False
+    from_registry = False
+    if not shared and startup_mode == STARTUP_MODE_BACKGROUND:
+        if await coordinator.async_restore():
+            background = True
+        elif er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+            background = from_registry = True
+
+    if not shared and not background:
+        # First refresh to populate data
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            _LOGGER.error("Error fetching initial data: %s", coordinator.last_exception)
+            await _async_release_coordinator(hass, entry.entry_id, coordinator)
+            raise ConfigEntryNotReady
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug(
+        "INIT: Entities for '%s' created after %.2fs (%s startup)",
+        entry.title,
+        time.monotonic() - setup_started,
+        "background" if background else "blocking",
+    )
+
+    if background:
+        _async_track_ready(hass, entry, coordinator, setup_started, from_registry)
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} first refresh {entry.entry_id}",
+        )
+    else:
+        coordinator.ready_after = time.monotonic() - setup_started
+        _LOGGER.info(
+            "Entry '%s' ready after %.2fs", entry.title, coordinator.ready_after
+        )
+
+    entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
+    return True
+
 
-    entry.add_update_listener(_async_reload_entry)
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry and release its coordinator.
+
+    The update listener, the readiness listener and the background first
+    refresh are registered through the entry and are removed or cancelled
+    by Home Assistant itself once this returns.
+    """
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not unload_ok:
+        return False
+    coordinator = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    if coordinator is not None:
+        await _async_release_coordinator(hass, entry.entry_id, coordinator)
     return True
 
 
+@callback
+def _async_acquire_coordinator(
+    hass: HomeAssistant,
+    entry_id: str,
+    lat,
+    lon,
+    country,
+    lang,
+    apikey,
+    grid_precision: int = DEFAULT_GRID_PRECISION,
+    cache_ttl: int = DEFAULT_CACHE_TTL,
+) -> "PollenInformationDataUpdateCoordinator":
+    """Return the coordinator for these fetch parameters, creating it if needed.
+
+    Coordinators are registered under their normalized grid cell key and
+    language, and reference-counted by the config entries using them.
+    """
+    coordinators = hass.data[DOMAIN].setdefault(DATA_COORDINATORS, {})
+    key = _coordinator_key(country, lang, lat, lon, apikey, grid_precision)
+    coordinator = coordinators.get(key)
+    if coordinator is None:
+        coordinator = coordinators[key] = PollenInformationDataUpdateCoordinator(
+            hass,
+            lat,
+            lon,
+            country,
+            lang,
+            apikey,
+            grid_precision=grid_precision,
+            cache_ttl=cache_ttl,
+        )
+        get_refresh_scheduler(hass).register(coordinator.cell_key)
+    elif DEBUG:
+        _LOGGER.debug("INIT: Entry %s shares coordinator %s", entry_id, key)
+    coordinator.users.add(entry_id)
+    return coordinator
+
+
+async def _async_release_coordinator(
+    hass: HomeAssistant,
+    entry_id: str,
+    coordinator: "PollenInformationDataUpdateCoordinator",
+) -> None:
+    """Detach an entry from its coordinator and shut it down after the last user."""
+    coordinator.users.discard(entry_id)
+    if coordinator.users:
+        return
+    coordinators = hass.data[DOMAIN].get(DATA_COORDINATORS, {})
+    if coordinators.get(coordinator.registry_key) is coordinator:
+        del coordinators[coordinator.registry_key]
+        get_refresh_scheduler(hass).unregister(coordinator.cell_key)
+    await coordinator.async_shutdown()
+
+
+def _coordinator_key(country, lang, lat, lon, apikey, grid_precision) -> str:
+    """Return the registry key of the coordinator for these fetch parameters."""
+    return f"{grid_cell_key(country, lat, lon, apikey, grid_precision)}:{lang.lower()}"
+
+
+@callback
+def _async_track_ready(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: "PollenInformationDataUpdateCoordinator",
+    setup_started: float,
+    reload_on_data: bool,
+) -> None:
+    """Report when the background first refresh has delivered data.
+
+    Entities created from registry metadata only know their slugs, so the
+    entry is reloaded once real data is available to build them properly.
+    """
+    removed = False
+
+    @callback
+    def _async_remove() -> None:
+        nonlocal removed
+        if not removed:
+            removed = True
+            remove_listener()
+
+    @callback
+    def _async_on_update() -> None:
+        if not coordinator.last_update_success or coordinator.data is None:
+            return
+        _async_remove()
+        coordinator.ready_after = time.monotonic() - setup_started
+        _LOGGER.info(
+            "Entry '%s' ready after %.2fs", entry.title, coordinator.ready_after
+        )
+        if reload_on_data:
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    remove_listener = coordinator.async_add_listener(_async_on_update)
+    entry.async_on_unload(_async_remove)
+
+
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle config entry reload."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -103,15 +317,113 @@ async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 class PollenInformationDataUpdateCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch data from polleninformation.at."""
 
-    def __init__(self, hass: HomeAssistant, lat, lon, country, lang, apikey):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        lat,
+        lon,
+        country,
+        lang,
+        apikey,
+        grid_precision: int = DEFAULT_GRID_PRECISION,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+    ):
         """Initialize the data coordinator with API parameters."""
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
+        # Coordinators can be shared by several entries, so they are not bound
+        # to the entry that happened to create them.
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=None,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
         self.lat = lat
         self.lon = lon
         self.country = country
         self.lang = lang
         self.apikey = apikey
+        self.grid_precision = grid_precision
+        self.cache_ttl = cache_ttl
+        self.content_hash = None
         self.last_updated = None
+        # Local date the current content was first fetched on
+        self.issued: date | None = None
+        self.ready_after: float | None = None
+        self.users: set[str] = set()
+        self.consecutive_failures = 0
+        # Seconds the API asked us to wait after the last refresh was rate limited
+        self.retry_after: float | None = None
+        self.serving_stale = False
+        self.publication = PublicationSchedule()
+        self._publication_restored = False
+        self.season = SeasonTracker(country)
+        self._language_blocks: tuple[dict, dict] | None = None
+        # Bumped whenever data is replaced; entities key memoized state on it.
+        self.data_generation = 0
+
+    @property
+    def cell_key(self) -> str:
+        """Return the response cache key for this coordinator's location."""
+        return grid_cell_key(
+            self.country, self.lat, self.lon, self.apikey, self.grid_precision
+        )
+
+    @property
+    def registry_key(self) -> str:
+        """Return the key this coordinator is shared under."""
+        return _coordinator_key(
+            self.country,
+            self.lang,
+            self.lat,
+            self.lon,
+            self.apikey,
+            self.grid_precision,
+        )
+
+    async def async_restore(self) -> bool:
+        """Populate data from the last stored response, whatever its age.
+
+        Returns True if usable data was restored. The regular refresh still
+        runs afterwards and replaces the data if it is too old.
+        """
+        cached = await get_response_cache(self.hass).async_peek(
+            self.cell_key, self.lang
+        )
+        if cached is None or not self._is_valid_api_response(cached.data):
+            return False
+        self.data = await self._async_parse(cached.data, cached.issued)
+        self.content_hash = cached.content_hash
+        self.issued = cached.issued
+        self.data_generation += 1
+        _LOGGER.debug(
+            "COORDINATOR: Restored data for %s (age %.0fs)",
+            self.cell_key,
+            cached.age,
+        )
+        return True
+
+    async def _async_restore_publication(self) -> None:
+        """Restore the publication schedule learned before a restart or reload."""
+        self._publication_restored = True
+        cache = get_response_cache(self.hass)
+        stored = await cache.async_peek_publication(self.cell_key)
+        if stored is None:
+            return
+        self.publication.restore(stored)
+        cached = cache.peek(self.cell_key)
+        if self.content_hash is None and cached is not None:
+            # Let the first refresh notice a change since the last one seen.
+            self.content_hash = cached.content_hash
+
+    async def _async_parse(self, data: dict, issued: date) -> PollenForecast:
+        """Build the parsed forecast model from a payload fetched on `issued`."""
+        if self._language_blocks is None:
+            self._language_blocks = (
+                await async_get_language_block(self.hass, self.lang),
+                await async_get_language_block(self.hass, "en"),
+            )
+        return parse_forecast(data, *self._language_blocks, issued=issued)
 
     def _is_valid_api_response(self, result: dict | None) -> bool:
         if result is None:
@@ -124,7 +436,87 @@ class PollenInformationDataUpdateCoordinator(DataUpdateCoordinator):
             return False
         return True
 
-    async def _async_update_data(self) -> dict:
+    def _next_update_interval(self) -> timedelta:
+        """Return the delay until the next scheduled refresh.
+
+        Delays are spread across grid cells by the shared refresh scheduler,
+        so coordinators set up together do not refresh together, while those
+        sharing a cell refresh together and fetch once.
+        """
+        scheduler = get_refresh_scheduler(self.hass)
+        key = self.cell_key
+        if self.consecutive_failures:
+            step = min(self.consecutive_failures, len(RECOVERY_INTERVALS)) - 1
+            delay = min(RECOVERY_INTERVALS[step], SCAN_INTERVAL)
+            if self.retry_after:
+                # Do not come back before the API said it would take requests.
+                delay = max(delay, timedelta(seconds=self.retry_after))
+            return scheduler.spread(key, delay, RETRY_SPREAD)
+        now = dt_util.now()
+        if self.season.is_off_season(now.date()):
+            return scheduler.align(key, OFF_SEASON_INTERVAL, now)
+        if self.publication.expected_minute is None:
+            return scheduler.align(key, SCAN_INTERVAL, now)
+        delay = self.publication.next_interval(now, SCAN_INTERVAL)
+        return scheduler.spread(key, delay, PUBLICATION_SPREAD)
+
+    async def _async_update_data(self) -> PollenForecast:
+        """Fetch latest pollen data, parse it and schedule the next refresh.
+
+        Refreshes follow the publication schedule learned from content hash
+        changes, or run once a day outside the pollen season. After a
+        failure, or while stale data is served because the country's circuit
+        is open, the next refresh follows the faster recovery schedule instead,
+        but never comes before the Retry-After of a rate limited request.
+        """
+        if not self._publication_restored:
+            await self._async_restore_publication()
+        previous_hash = self.content_hash
+        self.retry_after = None
+        try:
+            result = await self._async_fetch_data()
+        except UpdateFailed:
+            self.consecutive_failures += 1
+            self.update_interval = self._next_update_interval()
+            _LOGGER.debug(
+                "COORDINATOR: Refresh failed %d time(s) in a row, retrying in %s",
+                self.consecutive_failures,
+                self.update_interval,
+            )
+            raise
+        if self.serving_stale:
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
+            self.publication.record(
+                self.last_updated,
+                previous_hash is not None and self.content_hash != previous_hash,
+            )
+            get_response_cache(self.hass).set_publication(
+                self.cell_key, self.publication.to_storage()
+            )
+        if self.data is not None and self.content_hash == previous_hash:
+            # Same payload as before: keep the parsed model and its generation.
+            # Its day indices still count from the date it was first fetched.
+            forecast = self.data
+        else:
+            self.data_generation += 1
+            forecast = await self._async_parse(result, self.issued)
+        if not self.serving_stale:
+            off_season = self.season.is_off_season(dt_util.now().date())
+            self.season.record(forecast.is_quiet)
+            if off_season != self.season.is_off_season(dt_util.now().date()):
+                _LOGGER.info(
+                    "COORDINATOR: %s for %s",
+                    "Pollen reported again, back to the normal refresh schedule"
+                    if off_season
+                    else "No pollen reported off season, refreshing once a day",
+                    self.cell_key,
+                )
+        self.update_interval = self._next_update_interval()
+        return forecast
+
+    async def _async_fetch_data(self) -> dict:
         """Fetch latest pollen data from API."""
         if DEBUG:
             _LOGGER.debug(
@@ -134,22 +526,36 @@ class PollenInformationDataUpdateCoordinator(DataUpdateCoordinator):
                 self.country,
                 self.lang,
             )
+        # Before the first successful refresh, accept a persisted response from
+        # before the restart as long as it is within the freshness window.
+        ttl = self.cache_ttl
+        if self.last_updated is None:
+            ttl = max(ttl, RESTORE_MAX_AGE)
+        requested = time.time()
         try:
-            result = await async_get_pollenat_data(
-                self.hass,
+            cached = await get_response_cache(self.hass).async_get_response(
                 self.lat,
                 self.lon,
                 self.country,
                 self.lang,
                 self.apikey,
+                precision=self.grid_precision,
+                ttl=ttl,
             )
+            result = cached.data
 
             if not self._is_valid_api_response(result):
                 raise UpdateFailed(
                     f"Invalid API response for {self.country}: missing or malformed data"
                 )
 
-            self.last_updated = datetime.now()
+            self.last_updated = dt_util.as_local(
+                dt_util.utc_from_timestamp(cached.fetched_at)
+            )
+            self.content_hash = cached.content_hash
+            self.issued = cached.issued
+            # Payloads fetched for this refresh are fresh even with a TTL of 0.
+            self.serving_stale = cached.fetched_at < requested and cached.age > ttl * 60
             if DEBUG:
                 _LOGGER.debug(
                     "COORDINATOR: API result keys: %s",
@@ -160,6 +566,9 @@ class PollenInformationDataUpdateCoordinator(DataUpdateCoordinator):
             raise
         except PollenApiAuthError as err:
             raise UpdateFailed(f"Authentication failed: {err}") from err
+        except PollenApiRateLimitError as err:
+            self.retry_after = err.retry_after
+            raise UpdateFailed(f"Rate limited: {err}") from err
         except PollenApiConnectionError as err:
             raise UpdateFailed(f"Connection failed: {err}") from err
         except PollenApiError as err:
@@ -4,11 +4,38 @@ See official API documentation: https://www.polleninformation.at/en/data-interfa
 """
 
 import asyncio
+import json
 import logging
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
 import aiohttp
 import async_timeout
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .circuit import get_circuit_breaker
+from .const import DATA_SESSION, DOMAIN
+from .metrics import (
+    OUTCOME_API_ERROR,
+    OUTCOME_AUTH,
+    OUTCOME_CONNECTION,
+    OUTCOME_MALFORMED,
+    OUTCOME_OK,
+    OUTCOME_RATE_LIMITED,
+    OUTCOME_TIMEOUT,
+    RequestTiming,
+    create_trace_config,
+    get_request_metrics,
+)
+from .polling import get_refresh_scheduler
+from .ratelimit import get_rate_limiter
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +48,32 @@ API_URL = (
     "&apikey={apikey}"
 )
 
+REQUEST_TIMEOUT = 15  # seconds per attempt
+
+# Retry policy: bounded attempts, exponential backoff with full jitter
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+# A Retry-After longer than this is not waited for; the caller's own
+# schedule takes over instead.
+RETRY_AFTER_MAX = 120.0  # seconds
+
+
+# JSON decoder for response bodies: orjson when installed, stdlib otherwise.
+# Replace with set_json_decoder() to plug in another implementation.
+_json_decoder = _orjson_loads or json.loads
+
+
+def set_json_decoder(decoder) -> None:
+    """Use `decoder(raw: bytes)` to decode API responses; None restores the default."""
+    global _json_decoder
+    _json_decoder = decoder or _orjson_loads or json.loads
+
+
+def decode_json(raw: bytes):
+    """Decode a raw response body with the configured JSON decoder."""
+    return _json_decoder(raw)
+
 
 class PollenApiError(Exception):
     """Base exception for pollen API errors."""
@@ -34,6 +87,29 @@ class PollenApiConnectionError(PollenApiError):
     """Network or connection error."""
 
 
+class PollenApiCircuitOpenError(PollenApiConnectionError):
+    """The circuit for this country is open; no request was sent."""
+
+
+class PollenApiRateLimitError(PollenApiError):
+    """Rate limited or temporarily unavailable (HTTP 429/503)."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: float | None = None,
+        status: int | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status = status
+
+
+# In-flight requests keyed by (country, lang, latitude, longitude, apikey).
+# Concurrent identical calls await the same task instead of sending their own GET.
+_INFLIGHT: dict[tuple, asyncio.Task] = {}
+
+
 async def async_get_pollenat_data(
     hass,
     latitude,
@@ -45,6 +121,12 @@ async def async_get_pollenat_data(
     """
     Fetches pollen information data from polleninformation.at using the new API.
 
+    Concurrent calls with identical parameters are coalesced into a single
+    HTTP request; every caller receives the same response (or exception).
+    Transient failures are retried with exponential backoff and full jitter,
+    honouring Retry-After on 429/503 responses. While the circuit breaker of
+    the country is open, calls fail immediately.
+
     Args:
         hass: Home Assistant instance (for potential async session).
         latitude: Latitude (float).
@@ -59,8 +141,151 @@ async def async_get_pollenat_data(
     Raises:
         PollenApiAuthError: If API key is invalid.
         PollenApiConnectionError: If network request fails.
+        PollenApiRateLimitError: If still rate limited after all attempts.
+        PollenApiCircuitOpenError: If the country's circuit is open.
         PollenApiError: For other API errors.
     """
+    key = (country, lang, latitude, longitude, apikey)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        # A background task, so Home Assistant cancels it on shutdown.
+        task = hass.async_create_background_task(
+            _async_fetch_guarded(hass, latitude, longitude, country, lang, apikey),
+            name=f"{DOMAIN} fetch {country}",
+        )
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda done: _release_inflight(key, done))
+    else:
+        _LOGGER.debug(
+            "Joining in-flight request for country=%s, lat=%s, lon=%s",
+            country,
+            latitude,
+            longitude,
+        )
+    # Shield the shared task so that one cancelled caller does not abort the
+    # request for everybody else waiting on it.
+    return await asyncio.shield(task)
+
+
+def _release_inflight(key: tuple, task: asyncio.Task) -> None:
+    """Drop a finished request from the in-flight registry."""
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    # Mark the exception as retrieved in case every waiter was cancelled.
+    if not task.cancelled():
+        task.exception()
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the full-jitter backoff delay before retry number `attempt`."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+async def _async_fetch_guarded(
+    hass,
+    latitude,
+    longitude,
+    country,
+    lang,
+    apikey,
+):
+    """Fetch the forecast through the circuit breaker of the country.
+
+    Only failures to reach the provider count against the circuit: connection
+    errors and 5xx responses. An authentication error or an API error message
+    means it is up. A 429 concerns a single API key, so it counts neither way.
+    """
+    breaker = get_circuit_breaker(country)
+    if not breaker.allow_request():
+        raise PollenApiCircuitOpenError(
+            f"Circuit open for {country}, next attempt in {breaker.retry_in():.0f}s"
+        )
+    try:
+        data = await _async_fetch_with_retry(
+            hass, latitude, longitude, country, lang, apikey
+        )
+    except PollenApiRateLimitError as err:
+        if err.status is not None and err.status >= 500:
+            breaker.record_failure(err)
+        else:
+            breaker.release_probe()
+        raise
+    except PollenApiConnectionError as err:
+        breaker.record_failure(err)
+        raise
+    except asyncio.CancelledError:
+        breaker.release_probe()
+        raise
+    except PollenApiError:
+        breaker.record_success()
+        raise
+    breaker.record_success()
+    return data
+
+
+async def _async_fetch_with_retry(
+    hass,
+    latitude,
+    longitude,
+    country,
+    lang,
+    apikey,
+):
+    """Fetch the forecast, retrying transient failures.
+
+    Authentication errors and API error messages are not retried.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return await _async_fetch_pollenat_data(
+                hass, latitude, longitude, country, lang, apikey
+            )
+        except (PollenApiRateLimitError, PollenApiConnectionError) as err:
+            if attempt + 1 >= RETRY_ATTEMPTS:
+                raise
+            retry_after = getattr(err, "retry_after", None)
+            if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+                raise
+            delay = max(retry_after or 0.0, _backoff_delay(attempt))
+            _LOGGER.debug(
+                "Attempt %d/%d for country=%s failed (%s), retrying in %.1fs",
+                attempt + 1,
+                RETRY_ATTEMPTS,
+                country,
+                err,
+                delay,
+            )
+            await asyncio.sleep(delay)
+    # Only reached if RETRY_ATTEMPTS is less than one.
+    raise PollenApiConnectionError("No request attempts configured")
+
+
+async def _async_fetch_pollenat_data(
+    hass,
+    latitude,
+    longitude,
+    country,
+    lang,
+    apikey,
+):
+    """Perform a single HTTP request against the forecast endpoint."""
     url = API_URL.format(
         country=country,
         lang=lang,
@@ -69,47 +294,116 @@ async def async_get_pollenat_data(
         apikey=apikey,
     )
 
+    # Every attempt spends a token of the API key's shared budget. The wait
+    # happens before the request timeout starts.
+    waited = await get_rate_limiter(apikey).async_acquire()
+
     _LOGGER.debug(
-        "Calling polleninformation.at for country=%s, lat=%s, lon=%s",
+        "Calling polleninformation.at for country=%s, lat=%s, lon=%s (waited %.2fs)",
         country,
         latitude,
         longitude,
+        waited,
     )
 
-    try:
-        session = async_get_clientsession(hass)
-        async with async_timeout.timeout(15):
-            async with session.get(
-                url,
-                headers={
-                    "Accept": "application/json, text/plain, */*",
-                    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-                },
-            ) as resp:
-                if resp.status == 401:
-                    raise PollenApiAuthError("Invalid API key")
-                if resp.status == 403:
-                    raise PollenApiAuthError("API key not authorized for this resource")
-                resp.raise_for_status()
-
-                data = await resp.json()
-
-                if isinstance(data, dict) and "error" in data:
-                    error_msg = data.get("error", "Unknown error")
-                    if "api key" in error_msg.lower():
-                        raise PollenApiAuthError(error_msg)
-                    raise PollenApiError(error_msg)
-
-                return data
+    # Only the request itself holds one of the fetch slots shared by all
+    # coordinators; token waits and retry backoff do not.
+    async with get_refresh_scheduler(hass).fetch_slots:
+        timing = RequestTiming()
+        try:
+            session = _get_session(hass)
+            async with async_timeout.timeout(REQUEST_TIMEOUT):
+                async with session.get(
+                    url,
+                    headers={
+                        "Accept": "application/json, text/plain, */*",
+                        "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+                    },
+                    trace_request_ctx=timing,
+                ) as resp:
+                    timing.status = resp.status
+                    if resp.status == 401:
+                        raise PollenApiAuthError("Invalid API key")
+                    if resp.status == 403:
+                        raise PollenApiAuthError(
+                            "API key not authorized for this resource"
+                        )
+                    if resp.status in (429, 503):
+                        raise PollenApiRateLimitError(
+                            f"API returned HTTP {resp.status}",
+                            _parse_retry_after(resp.headers.get("Retry-After")),
+                            resp.status,
+                        )
+                    if resp.status >= 500:
+                        raise PollenApiConnectionError(
+                            f"API returned HTTP {resp.status}: {resp.reason}"
+                        )
+                    resp.raise_for_status()
 
-    except PollenApiError:
-        raise
-    except asyncio.TimeoutError as e:
-        raise PollenApiConnectionError(f"Timeout connecting to API: {e}") from e
-    except aiohttp.ClientResponseError as e:
-        raise PollenApiError(f"API returned HTTP {e.status}: {e.message}") from e
-    except aiohttp.ClientError as e:
-        raise PollenApiConnectionError(f"HTTP client error: {e}") from e
-    except Exception as e:
-        _LOGGER.error("Error calling polleninformation.at: %s", e)
-        raise PollenApiConnectionError(f"Connection error: {e}") from e
+                    # Read the body once and decode it directly, skipping aiohttp's
+                    # content-type check and its str round-trip.
+                    raw = await resp.read()
+                    timing.bytes = len(raw)
+                    decode_started = time.perf_counter()
+                    try:
+                        data = decode_json(raw)
+                    except ValueError as err:
+                        timing.outcome = OUTCOME_MALFORMED
+                        raise PollenApiError(
+                            f"Malformed JSON in API response: {err}"
+                        ) from err
+                    finally:
+                        timing.decode = (time.perf_counter() - decode_started) * 1000
+
+                    if isinstance(data, dict) and "error" in data:
+                        error_msg = data.get("error", "Unknown error")
+                        if "api key" in error_msg.lower():
+                            raise PollenApiAuthError(error_msg)
+                        raise PollenApiError(error_msg)
+
+                    timing.outcome = OUTCOME_OK
+                    return data
+
+        except PollenApiError as e:
+            timing.outcome = timing.outcome or _outcome_class(e)
+            raise
+        except asyncio.TimeoutError as e:
+            timing.outcome = OUTCOME_TIMEOUT
+            raise PollenApiConnectionError(f"Timeout connecting to API: {e}") from e
+        except aiohttp.ClientResponseError as e:
+            timing.outcome = OUTCOME_API_ERROR
+            raise PollenApiError(f"API returned HTTP {e.status}: {e.message}") from e
+        except aiohttp.ClientError as e:
+            timing.outcome = OUTCOME_CONNECTION
+            raise PollenApiConnectionError(f"HTTP client error: {e}") from e
+        except Exception as e:
+            timing.outcome = OUTCOME_CONNECTION
+            _LOGGER.error("Error calling polleninformation.at: %s", e)
+            raise PollenApiConnectionError(f"Connection error: {e}") from e
+        finally:
+            # Cancelled requests have no outcome and are left out.
+            if timing.outcome is not None:
+                timing.finish()
+                get_request_metrics(country).record(timing)
+
+
+def _outcome_class(err: PollenApiError) -> str:
+    """Return the metrics outcome class of an API error."""
+    if isinstance(err, PollenApiAuthError):
+        return OUTCOME_AUTH
+    if isinstance(err, PollenApiRateLimitError):
+        return OUTCOME_RATE_LIMITED
+    if isinstance(err, PollenApiConnectionError):
+        return OUTCOME_CONNECTION
+    return OUTCOME_API_ERROR
+
+
+def _get_session(hass) -> aiohttp.ClientSession:
+    """Return the integration's client session, traced for request metrics."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session = domain_data.get(DATA_SESSION)
+    if session is None:
+        session = domain_data[DATA_SESSION] = async_create_clientsession(
+            hass, trace_configs=[create_trace_config()]
+        )
+    return session
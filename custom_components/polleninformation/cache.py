@@ -0,0 +1,369 @@
+"""Response cache for polleninformation.at forecasts.
+
+The forecast service returns the same payload for nearby coordinates, so
+responses are cached per snapped grid cell. All entries whose location falls
+in the same cell share one fetch and one parsed payload.
+
+Forecasts are fetched once per cell in CANONICAL_LANG. Other languages are
+built locally from language_map.json, so entries that differ only in language
+do not cost extra requests.
+
+The last good payload of every cell is also persisted through a
+`homeassistant.helpers.storage.Store`, so a restart can serve recent data
+without calling the API again. The publication schedule a coordinator
+learned for the cell is stored alongside.
+
+Every payload keeps the local date its content was first fetched on. Day
+indices in the payload count from that date, so refetching an unchanged
+payload after midnight must not move it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import date
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import PollenApiCircuitOpenError, async_get_pollenat_data
+from .const import (
+    CACHE_RETENTION,
+    CANONICAL_LANG,
+    DATA_RESPONSE_CACHE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_GRID_PRECISION,
+    DOMAIN,
+)
+from .utils import async_load_language_map, localize_payload
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.responses"
+SAVE_DELAY = 10  # seconds; coalesces the writes of a refresh burst
+
+
+def snap_coordinate(value: float, precision: int) -> float:
+    """Snap a latitude or longitude to the grid given by `precision` decimals."""
+    return round(float(value), precision)
+
+
+def grid_cell_key(
+    country: str,
+    latitude: float,
+    longitude: float,
+    apikey: str,
+    precision: int = DEFAULT_GRID_PRECISION,
+) -> str:
+    """Return the cache key for the forecast cell containing a location.
+
+    The key is language independent; see PollenResponseCache.async_localize.
+    The API key is only represented by a short digest, so keys are safe to
+    log and to write to disk.
+    """
+    key_digest = hashlib.sha256(apikey.strip().encode("utf-8")).hexdigest()[:8]
+    lat = snap_coordinate(latitude, precision)
+    lon = snap_coordinate(longitude, precision)
+    return f"{country.upper()}:{lat}:{lon}:{key_digest}"
+
+
+def content_hash(data: dict) -> str:
+    """Return a stable hash of a payload's content."""
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CachedResponse:
+    """A cached API payload, its wall-clock fetch time and content hash.
+
+    `issued` is the local date the content was first fetched on; it
+    defaults to the date of `fetched_at`.
+    """
+
+    __slots__ = ("content_hash", "data", "fetched_at", "issued")
+
+    def __init__(
+        self,
+        data: dict,
+        fetched_at: float,
+        digest: str | None = None,
+        issued: date | None = None,
+    ) -> None:
+        self.data = data
+        self.fetched_at = fetched_at
+        self.content_hash = digest or content_hash(data)
+        self.issued = (
+            issued or dt_util.as_local(dt_util.utc_from_timestamp(fetched_at)).date()
+        )
+
+    @property
+    def age(self) -> float:
+        """Age of the payload in seconds."""
+        return time.time() - self.fetched_at
+
+
+class PollenResponseCache:
+    """Response cache keyed by forecast grid cell, persisted to disk."""
+
+    def __init__(self, hass) -> None:
+        self.hass = hass
+        self._entries: dict[str, CachedResponse] = {}
+        # Cell key -> PublicationSchedule.to_storage() of its coordinators
+        self._publications: dict[str, dict] = {}
+        # (cell key, lang) -> (canonical response, localized response)
+        self._localized: dict[
+            tuple[str, str], tuple[CachedResponse, CachedResponse]
+        ] = {}
+        self._language_blocks: dict[str, dict] | None = None
+        # (lang, titles) already reported as missing from language_map.json
+        self._untranslated: set[tuple[str, tuple[str, ...]]] = set()
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load persisted responses once; later calls are no-ops."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            for key, record in stored.items():
+                try:
+                    issued = record.get("issued")
+                    cached = CachedResponse(
+                        record["data"],
+                        record["fetched_at"],
+                        record.get("hash"),
+                        date.fromisoformat(issued) if issued else None,
+                    )
+                except (KeyError, TypeError, ValueError):
+                    _LOGGER.debug("Ignoring malformed stored response for %s", key)
+                    continue
+                # Entries fetched while running take precedence over disk.
+                self._entries.setdefault(key, cached)
+                if isinstance(record.get("publication"), dict):
+                    self._publications.setdefault(key, record["publication"])
+            self._prune()
+            self._loaded = True
+            _LOGGER.debug("Restored %d cached responses", len(self._entries))
+
+    def peek(self, key: str) -> CachedResponse | None:
+        """Return the cached response for `key` regardless of its age."""
+        return self._entries.get(key)
+
+    async def async_peek(self, key: str, lang: str) -> CachedResponse | None:
+        """Return the cached response for `key` in `lang`, regardless of its age."""
+        await self.async_load()
+        cached = self.peek(key)
+        if cached is None:
+            return None
+        return await self.async_localize(key, cached, lang)
+
+    async def async_localize(
+        self, key: str, cached: CachedResponse, lang: str
+    ) -> CachedResponse:
+        """Return `cached` with allergen titles in `lang`.
+
+        Localized payloads are memoized per cell and language until the
+        canonical payload changes. They keep the fetch time, content hash and
+        issue date of the canonical payload. Allergens that language_map.json
+        has no names for keep their English title, and a warning is logged
+        once per language.
+        """
+        if lang == CANONICAL_LANG or not isinstance(cached.data, dict):
+            return cached
+        memo = self._localized.get((key, lang))
+        if memo is not None and memo[0] is cached:
+            return memo[1]
+        if self._language_blocks is None:
+            language_map = await async_load_language_map(self.hass)
+            self._language_blocks = {
+                block["lang_code"]: block
+                for block in language_map.values()
+                if isinstance(block, dict) and "lang_code" in block
+            }
+        block = self._language_blocks.get(lang)
+        if block is None:
+            self._warn_untranslated(lang, ("all allergens",))
+            return cached
+        known = {allergen.get("poll_id") for allergen in block.get("poll_titles", [])}
+        missing = tuple(
+            sorted(
+                str(item.get("poll_title"))
+                for item in cached.data.get("contamination", [])
+                if item.get("poll_id") not in known
+            )
+        )
+        if missing:
+            self._warn_untranslated(lang, missing)
+        localized = CachedResponse(
+            localize_payload(cached.data, block),
+            cached.fetched_at,
+            cached.content_hash,
+            cached.issued,
+        )
+        self._localized[(key, lang)] = (cached, localized)
+        return localized
+
+    async def async_peek_publication(self, key: str) -> dict | None:
+        """Return the publication schedule stored for `key`, if any."""
+        await self.async_load()
+        return self._publications.get(key)
+
+    def set_publication(self, key: str, stored: dict) -> None:
+        """Store the publication schedule of `key` and schedule a save to disk."""
+        self._publications[key] = stored
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _warn_untranslated(self, lang: str, titles: tuple[str, ...]) -> None:
+        """Log once that `titles` are shown in CANONICAL_LANG instead of `lang`."""
+        if (lang, titles) in self._untranslated:
+            return
+        self._untranslated.add((lang, titles))
+        _LOGGER.warning(
+            "No %s names in language_map.json for %s, showing them in %s",
+            lang,
+            ", ".join(titles),
+            CANONICAL_LANG,
+        )
+
+    def get(self, key: str, max_age: float) -> CachedResponse | None:
+        """Return the cached response for `key` if it is at most `max_age` seconds old."""
+        cached = self._entries.get(key)
+        if cached is None or cached.age > max_age:
+            return None
+        return cached
+
+    def set(self, key: str, data: dict) -> CachedResponse:
+        """Store a fresh payload for `key` and schedule a save to disk.
+
+        An unchanged payload keeps the issue date of the cached one.
+        """
+        previous = self._entries.get(key)
+        self._prune()
+        cached = CachedResponse(data, time.time())
+        if previous is not None and previous.content_hash == cached.content_hash:
+            cached.issued = previous.issued
+        self._entries[key] = cached
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return cached
+
+    def _prune(self) -> None:
+        """Drop entries older than CACHE_RETENTION.
+
+        Entries are kept well past the reuse TTL: until the next refresh of
+        their cell they are what a restart restores and what is served while
+        the country's circuit is open.
+        """
+        max_age = CACHE_RETENTION * 60
+        for key in [k for k, v in self._entries.items() if v.age > max_age]:
+            del self._entries[key]
+        for memo_key in [k for k in self._localized if k[0] not in self._entries]:
+            del self._localized[memo_key]
+        for key in [k for k in self._publications if k not in self._entries]:
+            del self._publications[key]
+
+    def _data_to_save(self) -> dict:
+        """Return the persisted representation of the cache."""
+        return {
+            key: {
+                "data": cached.data,
+                "fetched_at": cached.fetched_at,
+                "hash": cached.content_hash,
+                "issued": cached.issued.isoformat(),
+                "publication": self._publications.get(key),
+            }
+            for key, cached in self._entries.items()
+        }
+
+    async def async_get_response(
+        self,
+        latitude: float,
+        longitude: float,
+        country: str,
+        lang: str,
+        apikey: str,
+        precision: int = DEFAULT_GRID_PRECISION,
+        ttl: int = DEFAULT_CACHE_TTL,
+    ) -> CachedResponse:
+        """Return the forecast for a location, fetching it only on a cache miss.
+
+        The request is sent for the snapped cell coordinates and in
+        CANONICAL_LANG, so that every location in the cell maps to one
+        identical API call whatever the entry's language.
+
+        While the country's circuit breaker is open, the last cached payload
+        is returned regardless of its age.
+
+        Args:
+            precision: Number of decimals kept when snapping coordinates.
+            ttl: Minutes a cached response may be reused.
+        """
+        await self.async_load()
+        key = grid_cell_key(country, latitude, longitude, apikey, precision)
+        cached = await self._async_get_canonical(
+            key, latitude, longitude, country, apikey, precision, ttl
+        )
+        return await self.async_localize(key, cached, lang)
+
+    async def _async_get_canonical(
+        self,
+        key: str,
+        latitude: float,
+        longitude: float,
+        country: str,
+        apikey: str,
+        precision: int,
+        ttl: int,
+    ) -> CachedResponse:
+        """Return the canonical-language response for a cell."""
+        cached = self.get(key, ttl * 60)
+        if cached is not None:
+            _LOGGER.debug(
+                "Serving cached forecast for cell %s (age %.0fs)", key, cached.age
+            )
+            return cached
+
+        try:
+            data = await async_get_pollenat_data(
+                self.hass,
+                snap_coordinate(latitude, precision),
+                snap_coordinate(longitude, precision),
+                country,
+                CANONICAL_LANG,
+                apikey,
+            )
+        except PollenApiCircuitOpenError:
+            # The provider is down for this country; serve the last payload
+            # we have, however old, instead of failing.
+            cached = self.peek(key)
+            if cached is None:
+                raise
+            _LOGGER.debug(
+                "Circuit open, serving stale forecast for cell %s (age %.0fs)",
+                key,
+                cached.age,
+            )
+            return cached
+        if not isinstance(data, dict) or not isinstance(
+            data.get("contamination"), list
+        ):
+            # Malformed payloads are handed to the caller but never cached.
+            return CachedResponse(data, time.time(), "")
+        return self.set(key, data)
+
+
+def get_response_cache(hass) -> PollenResponseCache:
+    """Return the response cache shared by all entries of this integration."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_RESPONSE_CACHE)
+    if cache is None:
+        cache = domain_data[DATA_RESPONSE_CACHE] = PollenResponseCache(hass)
+    return cache
@@ -0,0 +1,110 @@
+"""Circuit breakers for polleninformation.at, one per country endpoint.
+
+When the provider is down for a country, every coordinator for that country
+would otherwise wait for its own timeouts and retries. After a number of
+consecutive failed fetches the circuit opens and calls fail immediately, so
+callers can fall back to cached data. After a cool-down a single probe
+request is let through (half-open); its outcome closes or re-opens the
+circuit.
+"""
+
+from __future__ import annotations
+
+import time
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failed fetches, retries included
+CIRCUIT_RESET_TIMEOUT = 300.0  # seconds the circuit stays open before a probe
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probe_in_flight = False
+        self.last_error: str | None = None
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving from open to half-open after the cool-down."""
+        if self.opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now.
+
+        In the half-open state only one probe request is allowed at a time.
+        """
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+        self.last_error = None
+
+    def release_probe(self) -> None:
+        """End a request that tells nothing about the endpoint's health."""
+        self.probe_in_flight = False
+
+    def record_failure(self, error: Exception) -> None:
+        """Count a failed request and open the circuit once the threshold is hit."""
+        self.failures += 1
+        self.last_error = str(error)
+        if self.probe_in_flight or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+            # A failed probe restarts the cool-down.
+            self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def as_dict(self) -> dict:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "times_opened": self.times_opened,
+            "retry_in": round(self.retry_in(), 1),
+            "last_error": self.last_error,
+        }
+
+
+# Process-wide breakers keyed by country code
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(country: str) -> CircuitBreaker:
+    """Return the circuit breaker for a country endpoint."""
+    key = country.upper()
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = _BREAKERS[key] = CircuitBreaker()
+    return breaker
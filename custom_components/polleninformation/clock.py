@@ -0,0 +1,91 @@
+"""Shared local clock ticks for polleninformation entities.
+
+Some states depend on the local time as well as on the data: the current
+hour of the hourly allergy risk, and the current day of every daily
+forecast. Instead of every entity tracking time on its own, one time
+listener per Home Assistant instance and time pattern (every full hour,
+local midnight) calls all subscribed entities, which recompute their state
+from the data they already hold. No API requests are made.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DATA_CLOCKS, DOMAIN
+
+CLOCK_HOURLY = "hourly"
+CLOCK_MIDNIGHT = "midnight"
+
+_TIME_PATTERNS: dict[str, dict[str, int]] = {
+    CLOCK_HOURLY: {"minute": 0, "second": 0},
+    CLOCK_MIDNIGHT: {"hour": 0, "minute": 0, "second": 0},
+}
+
+
+class SharedClock:
+    """Calls its listeners whenever the local time matches a pattern.
+
+    The underlying time listener only exists while there are subscribers.
+    """
+
+    def __init__(self, hass: HomeAssistant, pattern: dict[str, int]) -> None:
+        self.hass = hass
+        self._pattern = pattern
+        self._listeners: dict[object, Callable[[datetime], None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_listener(self, action: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Call `action(now)` on every match; return a function that unsubscribes."""
+        token = object()
+        self._listeners[token] = action
+        if self._unsub is None:
+            self._unsub = async_track_time_change(
+                self.hass, self._async_tick, **self._pattern
+            )
+
+        @callback
+        def _async_remove() -> None:
+            self._listeners.pop(token, None)
+            if not self._listeners and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_remove
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        for action in list(self._listeners.values()):
+            action(now)
+
+
+@callback
+def _async_track_clock(
+    hass: HomeAssistant, name: str, action: Callable[[datetime], None]
+) -> CALLBACK_TYPE:
+    clocks = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_CLOCKS, {})
+    clock = clocks.get(name)
+    if clock is None:
+        clock = clocks[name] = SharedClock(hass, _TIME_PATTERNS[name])
+    return clock.async_add_listener(action)
+
+
+@callback
+def async_track_hourly_tick(
+    hass: HomeAssistant, action: Callable[[datetime], None]
+) -> CALLBACK_TYPE:
+    """Subscribe `action` to the shared clock firing at every full hour."""
+    return _async_track_clock(hass, CLOCK_HOURLY, action)
+
+
+@callback
+def async_track_local_midnight(
+    hass: HomeAssistant, action: Callable[[datetime], None]
+) -> CALLBACK_TYPE:
+    """Subscribe `action` to the shared clock firing at local midnight."""
+    return _async_track_clock(hass, CLOCK_MIDNIGHT, action)
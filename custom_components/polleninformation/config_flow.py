@@ -15,8 +15,8 @@ from .api import (
     PollenApiAuthError,
     PollenApiConnectionError,
     PollenApiError,
-    async_get_pollenat_data,
 )
+from .cache import get_response_cache
 from .const import API_KEY_REQUEST_URL, DEFAULT_LANG, DOMAIN
 from .options_flow import OptionsFlowHandler
 from .utils import (
@@ -181,21 +181,24 @@ class PolleninformationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Validate via API call (only if no previous errors)
             if not errors:
                 _LOGGER.debug(
-                    "Calling async_get_pollenat_data with: lat=%r, lon=%r, country=%r, lang=%r",
+                    "Fetching pollen data with: lat=%r, lon=%r, country=%r, lang=%r",
                     latitude,
                     longitude,
                     country_code,
                     lang_code,
                 )
+                # Go through the shared response cache: the validated payload
+                # stays there, so the new entry's first refresh is served from
+                # memory instead of fetching the same forecast again.
                 try:
-                    pollen_data = await async_get_pollenat_data(
-                        self.hass,
+                    response = await get_response_cache(self.hass).async_get_response(
                         latitude,
                         longitude,
                         country_code,
                         lang_code,
                         apikey,
                     )
+                    pollen_data = response.data
                 except PollenApiAuthError:
                     errors["apikey"] = "invalid_api_key"
                     pollen_data = None
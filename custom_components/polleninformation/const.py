@@ -18,13 +18,54 @@ CONF_COUNTRY = "country"  # ISO alpha-2, e.g. "SE"
 CONF_LANG = "lang"  # ISO 639-1 language code, e.g. "sv"
 CONF_APIKEY = "apikey"
 
+# Option keys
+CONF_GRID_PRECISION = "grid_precision"  # decimals kept when snapping lat/lon
+CONF_CACHE_TTL = "cache_ttl"  # minutes a cached response may be reused
+CONF_STARTUP_MODE = "startup_mode"
+CONF_RATE_LIMIT = "rate_limit"  # requests per minute per API key
+CONF_RATE_BURST = "rate_burst"  # requests allowed back to back per API key
+CONF_FORECAST_ATTRIBUTES = "forecast_attributes"  # forecast lists in attributes
+
+# Startup modes
+STARTUP_MODE_BLOCKING = "blocking"  # wait for the first refresh before adding entities
+STARTUP_MODE_BACKGROUND = "background"  # add entities at once, refresh in background
+STARTUP_MODES = [STARTUP_MODE_BACKGROUND, STARTUP_MODE_BLOCKING]
+
 # Default configuration values
 DEFAULT_LATITUDE = 46.628
 DEFAULT_LONGITUDE = 14.309
 DEFAULT_COUNTRY = "AT"  # ISO alpha-2 country code
 DEFAULT_LANG = "en"
+# Language every forecast is fetched in; other languages are built locally
+CANONICAL_LANG = "en"
 DEFAULT_NAME = "Polleninformation"
 DEFAULT_APIKEY = ""  # Empty by default; must be set by user
+DEFAULT_GRID_PRECISION = 2  # ~1 km cells; the forecast grid is coarser than that
+DEFAULT_CACHE_TTL = 30  # minutes
+DEFAULT_STARTUP_MODE = STARTUP_MODE_BACKGROUND
+DEFAULT_RATE_LIMIT = 30  # requests per minute
+DEFAULT_RATE_BURST = 5
+DEFAULT_FORECAST_ATTRIBUTES = True
+
+# Allowed option ranges
+MAX_GRID_PRECISION = 4
+MAX_CACHE_TTL = 480  # minutes a response may be reused, at most the scan interval
+MAX_RATE_LIMIT = 600  # requests per minute
+MAX_RATE_BURST = 50
+
+# Responses persisted before a restart are served on setup up to this age
+RESTORE_MAX_AGE = 120  # minutes
+
+# Responses are kept this long for restores and while a circuit is open,
+# longer than the longest refresh interval (36 hours off season)
+CACHE_RETENTION = 48 * 60  # minutes
+
+# Keys in hass.data[DOMAIN] that are not config entry ids
+DATA_RESPONSE_CACHE = "response_cache"
+DATA_COORDINATORS = "coordinators"
+DATA_SESSION = "session"
+DATA_CLOCKS = "clocks"
+DATA_SCHEDULER = "scheduler"
 
 # URL for requesting an API key
 API_KEY_REQUEST_URL = (
@@ -0,0 +1,59 @@
+"""Diagnostics support for polleninformation.at integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .circuit import get_circuit_breaker
+from .const import CONF_APIKEY, DOMAIN
+from .metrics import get_request_metrics
+from .polling import get_refresh_scheduler
+from .ratelimit import get_rate_limiter_stats
+
+# The cell key holds the snapped coordinates of the location
+TO_REDACT = {CONF_APIKEY, "latitude", "longitude", "cell_key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+    }
+    if coordinator is None:
+        return diagnostics
+
+    diagnostics["coordinator"] = async_redact_data(
+        {
+            "cell_key": coordinator.cell_key,
+            "users": len(coordinator.users),
+            "last_update_success": coordinator.last_update_success,
+            "last_updated": coordinator.last_updated.isoformat()
+            if coordinator.last_updated
+            else None,
+            "update_interval": str(coordinator.update_interval),
+            "consecutive_failures": coordinator.consecutive_failures,
+            "serving_stale": coordinator.serving_stale,
+            "content_hash": coordinator.content_hash,
+            "ready_after": coordinator.ready_after,
+            "publication": coordinator.publication.as_dict(),
+            "season": coordinator.season.as_dict(),
+        },
+        TO_REDACT,
+    )
+    diagnostics["rate_limiter"] = get_rate_limiter_stats(coordinator.apikey)
+    diagnostics["circuit_breaker"] = get_circuit_breaker(coordinator.country).as_dict()
+    diagnostics["request_metrics"] = get_request_metrics(coordinator.country).as_dict()
+    diagnostics["refresh_scheduler"] = get_refresh_scheduler(hass).as_dict(
+        coordinator.cell_key
+    )
+    return diagnostics
@@ -0,0 +1,179 @@
+"""Request timing for polleninformation.at, one ring buffer per country.
+
+Every HTTP request sent by api.py is timed through an aiohttp TraceConfig
+(DNS lookup, connection setup, time to first byte, total) and annotated with
+the response size, the JSON decode time and an outcome class. The most recent
+samples of each country are kept so diagnostics and the optional response
+time sensor can report percentiles from real traffic.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+
+import aiohttp
+
+METRICS_WINDOW = 200  # samples kept per country
+
+# Outcome classes
+OUTCOME_OK = "ok"
+OUTCOME_AUTH = "auth"
+OUTCOME_RATE_LIMITED = "rate_limited"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CONNECTION = "connection"
+OUTCOME_MALFORMED = "malformed"
+OUTCOME_API_ERROR = "api_error"
+
+# Sample fields summarised as percentiles; durations are in milliseconds
+TIMING_FIELDS = ("total", "ttfb", "connect", "dns", "decode")
+PERCENTILES = (50, 95, 99)
+
+
+class RequestTiming:
+    """Timings and outcome of a single HTTP request."""
+
+    __slots__ = (
+        "bytes",
+        "connect",
+        "connect_started",
+        "decode",
+        "dns",
+        "dns_started",
+        "outcome",
+        "started",
+        "status",
+        "total",
+        "ttfb",
+    )
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.dns_started: float | None = None
+        self.connect_started: float | None = None
+        self.dns: float | None = None
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.total: float | None = None
+        self.decode: float | None = None
+        self.bytes: int | None = None
+        self.outcome: str | None = None
+        self.status: int | None = None
+
+    def since_start(self) -> float:
+        """Return milliseconds elapsed since the request started."""
+        return (time.perf_counter() - self.started) * 1000
+
+    def finish(self) -> None:
+        """Set the total duration."""
+        self.total = self.since_start()
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    """Return the nearest-rank percentile of sorted `values`."""
+    index = max(0, -(-len(values) * percentile // 100) - 1)
+    return values[index]
+
+
+class RequestMetrics:
+    """Bounded history of request timings for one country."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.samples: deque[RequestTiming] = deque(maxlen=window)
+        self.requests = 0
+
+    def record(self, timing: RequestTiming) -> None:
+        """Add a finished request."""
+        self.samples.append(timing)
+        self.requests += 1
+
+    def percentile(self, field: str, percentile: int) -> float | None:
+        """Return a percentile of one field over the buffered samples."""
+        values = sorted(
+            value
+            for timing in self.samples
+            if (value := getattr(timing, field)) is not None
+        )
+        if not values:
+            return None
+        return round(_percentile(values, percentile), 1)
+
+    def as_dict(self) -> dict:
+        """Return percentiles, response sizes and outcome counts for diagnostics."""
+        summary: dict = {
+            "requests": self.requests,
+            "samples": len(self.samples),
+            "outcomes": dict(Counter(timing.outcome for timing in self.samples)),
+        }
+        for field in (*TIMING_FIELDS, "bytes"):
+            summary[field] = {
+                f"p{percentile}": self.percentile(field, percentile)
+                for percentile in PERCENTILES
+            }
+        return summary
+
+
+# Process-wide metrics keyed by country code
+_METRICS: dict[str, RequestMetrics] = {}
+
+
+def get_request_metrics(country: str) -> RequestMetrics:
+    """Return the request metrics of a country endpoint."""
+    key = country.upper()
+    metrics = _METRICS.get(key)
+    if metrics is None:
+        metrics = _METRICS[key] = RequestMetrics()
+    return metrics
+
+
+# TraceConfig callbacks. Requests pass their RequestTiming as
+# trace_request_ctx; requests without one are ignored.
+
+
+async def _on_dns_resolvehost_start(session, ctx, params) -> None:
+    if timing := ctx.trace_request_ctx:
+        timing.dns_started = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session, ctx, params) -> None:
+    if (timing := ctx.trace_request_ctx) and timing.dns_started is not None:
+        timing.dns = (time.perf_counter() - timing.dns_started) * 1000
+
+
+async def _on_dns_cache_hit(session, ctx, params) -> None:
+    if timing := ctx.trace_request_ctx:
+        timing.dns = 0.0
+
+
+async def _on_connection_create_start(session, ctx, params) -> None:
+    if timing := ctx.trace_request_ctx:
+        timing.connect_started = time.perf_counter()
+
+
+async def _on_connection_create_end(session, ctx, params) -> None:
+    if (timing := ctx.trace_request_ctx) and timing.connect_started is not None:
+        timing.connect = (time.perf_counter() - timing.connect_started) * 1000
+
+
+async def _on_connection_reuseconn(session, ctx, params) -> None:
+    if timing := ctx.trace_request_ctx:
+        timing.connect = 0.0
+
+
+async def _on_request_end(session, ctx, params) -> None:
+    # Fired once the response headers have been received.
+    if timing := ctx.trace_request_ctx:
+        timing.ttfb = timing.since_start()
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return a TraceConfig that fills in the RequestTiming of each request."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
@@ -0,0 +1,219 @@
+"""Parsed forecast model for polleninformation.at responses.
+
+The coordinator turns each API payload into a PollenForecast once per
+refresh. Entities read the parsed records instead of splitting titles and
+looking up "contamination_<day>" keys on every state write, and the raw
+payload is not kept per coordinator.
+
+Day indices are relative to the local date the payload was first fetched
+on, stored as PollenForecast.issued. After local midnight, entities shift their index by
+day_offset() so "today" keeps pointing at the right values until the next
+refresh.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from functools import lru_cache
+
+from homeassistant.util import dt as dt_util
+
+from .utils import get_allergen_info_by_latin, normalize, slugify
+
+FORECAST_DAYS = 4
+
+# Stored in level arrays for values that are missing or not numeric
+MISSING = -1
+
+# Allergen names repeat across refreshes and locations, so the string work
+# of normalizing them is done once per distinct name.
+_normalize = lru_cache(maxsize=1024)(normalize)
+_slugify = lru_cache(maxsize=1024)(slugify)
+
+
+def _to_level(value) -> int:
+    """Return `value` as a small int level, or MISSING."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return MISSING
+    return max(MISSING, min(127, round(value)))
+
+
+def _levels(values) -> array:
+    """Return a compact signed byte array of levels."""
+    values = list(values)
+    try:
+        # Fast path: the API sends small ints.
+        return array("b", values)
+    except (TypeError, OverflowError):
+        return array("b", [_to_level(value) for value in values])
+
+
+def split_poll_title(poll_title: str) -> tuple[str, str]:
+    """Split "name (Latin)" into name and Latin name; Latin may be empty."""
+    name, _, rest = poll_title.partition("(")
+    latin = rest.split(")", 1)[0].strip() if rest else ""
+    return name.strip(), latin
+
+
+class AllergenForecast:
+    """Daily forecast of one allergen."""
+
+    __slots__ = ("latin", "levels", "name", "name_en", "poll_id", "slug")
+
+    def __init__(
+        self,
+        poll_id: int | None,
+        name: str,
+        latin: str,
+        name_en: str,
+        slug: str,
+        levels: array,
+    ) -> None:
+        self.poll_id = poll_id
+        self.name = name  # in the coordinator's language
+        self.latin = latin
+        self.name_en = name_en
+        self.slug = slug  # English slug, as used in unique ids
+        self.levels = levels  # one level per day, issue date first
+
+    def level(self, day: int) -> int | None:
+        """Return the level of day `day` (0 = issue date), or None if unknown."""
+        if 0 <= day < len(self.levels) and self.levels[day] != MISSING:
+            return self.levels[day]
+        return None
+
+
+class PollenForecast:
+    """All forecasts of one location, as returned by a single API response.
+
+    Allergens are indexed by slug and by normalized name, so entities
+    resolve their record with one dict lookup.
+    """
+
+    __slots__ = ("_index", "allergens", "issued", "risk_daily", "risk_hourly")
+
+    def __init__(
+        self,
+        allergens: tuple[AllergenForecast, ...],
+        risk_daily: array,
+        risk_hourly: tuple[array, ...],
+        issued: date,
+    ) -> None:
+        self.allergens = allergens
+        self.risk_daily = risk_daily  # raw allergy risk per day
+        self.risk_hourly = risk_hourly  # raw allergy risk per hour, per day
+        self.issued = issued  # local date of day index 0
+        self._index: dict[str, AllergenForecast] = {}
+        for allergen in allergens:
+            for key in (allergen.name, allergen.name_en, allergen.latin):
+                if key:
+                    self._index.setdefault(_normalize(key), allergen)
+        # Slugs win over names that happen to normalize to another slug.
+        self._index.update((allergen.slug, allergen) for allergen in allergens)
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if the response had no allergens."""
+        return not self.allergens
+
+    @property
+    def is_quiet(self) -> bool:
+        """Return True if no allergen or allergy risk is above level 0."""
+        return (
+            not any(max(allergen.levels, default=0) > 0 for allergen in self.allergens)
+            and max(self.risk_daily, default=0) <= 0
+        )
+
+    def day_offset(self, today: date | None = None) -> int:
+        """Return the day index of `today` (default: the local date)."""
+        if today is None:
+            today = dt_util.now().date()
+        return max(0, (today - self.issued).days)
+
+    def get_allergen(self, key: str) -> AllergenForecast | None:
+        """Return the record of an allergen by English slug or by name.
+
+        Slugs are looked up directly; names in any case or spelling that
+        normalizes the same (localized, English or Latin) are normalized
+        first.
+        """
+        allergen = self._index.get(key)
+        if allergen is None:
+            allergen = self._index.get(_normalize(key))
+        return allergen
+
+    def risk(self, day: int) -> int | None:
+        """Return the raw daily allergy risk of day `day`, or None."""
+        if 0 <= day < len(self.risk_daily) and self.risk_daily[day] != MISSING:
+            return self.risk_daily[day]
+        return None
+
+    def hourly_risk(self, day: int, hour: int) -> int | None:
+        """Return the raw allergy risk of an hour of day `day`, or None."""
+        if not 0 <= day < len(self.risk_hourly):
+            return None
+        values = self.risk_hourly[day]
+        if 0 <= hour < len(values) and values[hour] != MISSING:
+            return values[hour]
+        return None
+
+
+def parse_forecast(
+    data: dict,
+    language_block: dict,
+    language_block_en: dict,
+    issued: date | None = None,
+) -> PollenForecast:
+    """Build a PollenForecast from an API payload.
+
+    `language_block` is the block of the payload's language and is used to
+    find the Latin name of allergens whose title lacks one;
+    `language_block_en` supplies the English names the slugs are built from.
+    `issued` is the local date the payload was first fetched on, default
+    today.
+    """
+    allergens = []
+    for item in data.get("contamination", []):
+        name, latin = split_poll_title(item.get("poll_title", "<unknown>"))
+        name = name[:1].upper() + name[1:]
+        if not latin:
+            for allergen in language_block.get("poll_titles", []):
+                if allergen.get("name") == name:
+                    latin = allergen.get("latin") or ""
+                    break
+        info_en = (
+            get_allergen_info_by_latin(latin, language_block_en) if latin else None
+        )
+        name_en = info_en["name"] if info_en else name
+        allergens.append(
+            AllergenForecast(
+                poll_id=item.get("poll_id"),
+                name=name,
+                latin=latin,
+                name_en=name_en,
+                slug=_slugify(name_en),
+                levels=_levels(
+                    item.get(f"contamination_{day}", 0)
+                    for day in range(1, FORECAST_DAYS + 1)
+                ),
+            )
+        )
+
+    allergyrisk = data.get("allergyrisk") or {}
+    allergyrisk_hourly = data.get("allergyrisk_hourly") or {}
+    return PollenForecast(
+        allergens=tuple(allergens),
+        risk_daily=_levels(
+            allergyrisk.get(f"allergyrisk_{day}") for day in range(1, FORECAST_DAYS + 1)
+        )
+        if allergyrisk
+        else array("b"),
+        risk_hourly=tuple(
+            _levels(allergyrisk_hourly.get(f"allergyrisk_hourly_{day}") or [])
+            for day in range(1, FORECAST_DAYS + 1)
+        )
+        if allergyrisk_hourly
+        else (),
+        issued=issued or dt_util.now().date(),
+    )
@@ -12,7 +12,27 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.helpers.selector import LocationSelector, LocationSelectorConfig
 
-from .const import API_KEY_REQUEST_URL, DEFAULT_LANG
+from .const import (
+    API_KEY_REQUEST_URL,
+    CONF_CACHE_TTL,
+    CONF_FORECAST_ATTRIBUTES,
+    CONF_GRID_PRECISION,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_STARTUP_MODE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_FORECAST_ATTRIBUTES,
+    DEFAULT_GRID_PRECISION,
+    DEFAULT_LANG,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STARTUP_MODE,
+    MAX_CACHE_TTL,
+    MAX_GRID_PRECISION,
+    MAX_RATE_BURST,
+    MAX_RATE_LIMIT,
+    STARTUP_MODES,
+)
 from .utils import async_get_country_options, async_get_language_options
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +79,16 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         default_language = defaults.get("lang", default_lang_code)
         default_apikey = defaults.get("apikey", "")
         default_location_name = defaults.get("location", "")
+        default_grid_precision = defaults.get(
+            CONF_GRID_PRECISION, DEFAULT_GRID_PRECISION
+        )
+        default_cache_ttl = defaults.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL)
+        default_startup_mode = defaults.get(CONF_STARTUP_MODE, DEFAULT_STARTUP_MODE)
+        default_rate_limit = defaults.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+        default_rate_burst = defaults.get(CONF_RATE_BURST, DEFAULT_RATE_BURST)
+        default_forecast_attributes = defaults.get(
+            CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+        )
 
         data_schema = vol.Schema(
             {
@@ -78,6 +108,24 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 ),
                 vol.Required("apikey", default=default_apikey): str,
                 vol.Optional("location_name", default=default_location_name): str,
+                vol.Optional(
+                    CONF_GRID_PRECISION, default=default_grid_precision
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_GRID_PRECISION)),
+                vol.Optional(CONF_CACHE_TTL, default=default_cache_ttl): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_CACHE_TTL)
+                ),
+                vol.Optional(CONF_STARTUP_MODE, default=default_startup_mode): vol.In(
+                    STARTUP_MODES
+                ),
+                vol.Optional(CONF_RATE_LIMIT, default=default_rate_limit): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_RATE_LIMIT)
+                ),
+                vol.Optional(CONF_RATE_BURST, default=default_rate_burst): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_RATE_BURST)
+                ),
+                vol.Optional(
+                    CONF_FORECAST_ATTRIBUTES, default=default_forecast_attributes
+                ): bool,
             }
         )
 
@@ -148,6 +196,24 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                         "location": location_name,
                         "location_title": location_title,
                         "location_slug": location_slug,
+                        CONF_GRID_PRECISION: user_input.get(
+                            CONF_GRID_PRECISION, DEFAULT_GRID_PRECISION
+                        ),
+                        CONF_CACHE_TTL: user_input.get(
+                            CONF_CACHE_TTL, DEFAULT_CACHE_TTL
+                        ),
+                        CONF_STARTUP_MODE: user_input.get(
+                            CONF_STARTUP_MODE, DEFAULT_STARTUP_MODE
+                        ),
+                        CONF_RATE_LIMIT: user_input.get(
+                            CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT
+                        ),
+                        CONF_RATE_BURST: user_input.get(
+                            CONF_RATE_BURST, DEFAULT_RATE_BURST
+                        ),
+                        CONF_FORECAST_ATTRIBUTES: user_input.get(
+                            CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+                        ),
                     },
                 )
         return self.async_show_form(
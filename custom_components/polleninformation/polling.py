@@ -0,0 +1,289 @@
+"""Refresh scheduling for polleninformation.at coordinators.
+
+polleninformation.at publishes new forecasts about once a day. Each
+coordinator keeps a PublicationSchedule that learns when, from the
+refreshes in which the payload's content hash changed, and schedules the
+next refresh shortly after the expected publication. Until enough changes
+have been seen, and whenever the schedule has nothing better, refreshes
+fall back to a fixed interval. The learned samples are persisted per grid
+cell with the cached payload, so restarts and reloads keep them.
+
+Outside the pollen season every level stays at 0 for weeks. A SeasonTracker
+counts consecutive refreshes without any pollen and switches the
+coordinator to a daily refresh after OFF_SEASON_REFRESHES of them, unless
+the country's season calendar says pollen is expected. The first refresh
+with any pollen restores the normal schedule.
+
+Coordinators created together at startup would otherwise refresh together
+forever. The RefreshScheduler shared by all coordinators gives each grid cell
+a phase, spread evenly by rank with a deterministic jitter from its key.
+Coordinators of the same cell in different languages share the phase, so the
+second one is served from the response cache or joins the in-flight request.
+Fixed-interval refreshes are aligned to that phase within the interval,
+and refreshes after a publication or a failure are spread over a short
+window. It also caps how many HTTP requests to the API run at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+# Number of observed publications the estimate is based on
+PUBLICATION_SAMPLES = 14
+MIN_PUBLICATION_SAMPLES = 3
+# Refresh this long after the expected publication
+PUBLICATION_MARGIN = timedelta(minutes=15)
+# A change seen this close to the expected time counts as that publication;
+# while it is missing, refresh every LATE_RETRY for as long.
+PUBLICATION_TOLERANCE = timedelta(hours=6)
+LATE_RETRY = timedelta(hours=1)
+# Longest wait between refreshes once the schedule is known
+MAX_INTERVAL = timedelta(hours=12)
+MIN_INTERVAL = timedelta(minutes=5)
+
+# Consecutive refreshes without pollen before refreshing once a day only
+OFF_SEASON_REFRESHES = 6
+OFF_SEASON_INTERVAL = timedelta(hours=24)
+
+# First and last month of the usual pollen season per country. In these
+# months the normal schedule is kept even if no pollen has been reported
+# yet, so the start of the season is not missed by a day. Countries not
+# listed rely on the reported levels alone.
+SEASON_CALENDARS: dict[str, tuple[int, int]] = {
+    "AT": (2, 10),
+    "CH": (2, 10),
+    "DE": (2, 10),
+    "ES": (1, 10),
+    "FR": (2, 10),
+    "GB": (2, 9),
+    "IT": (1, 10),
+    "LT": (3, 9),
+    "LV": (3, 9),
+    "PL": (2, 10),
+    "SE": (3, 9),
+    "TR": (1, 10),
+    "UA": (2, 10),
+}
+
+# Windows that publication-aligned refreshes and retries are spread over
+PUBLICATION_SPREAD = timedelta(minutes=20)
+RETRY_SPREAD = timedelta(minutes=5)
+MAX_CONCURRENT_FETCHES = 2  # HTTP requests in flight, across all coordinators
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+class PublicationSchedule:
+    """Learns the local time of day at which a location's forecast changes.
+
+    A change is only noticed at the first refresh after it, so each one is
+    recorded as the middle of the window since the previous refresh,
+    weighted by how short that window was. The expected publication time is
+    the weighted circular mean of the recorded times.
+    """
+
+    def __init__(self) -> None:
+        self._samples: deque[tuple[float, float]] = deque(maxlen=PUBLICATION_SAMPLES)
+        self.last_fetch: datetime | None = None
+        self.last_change: datetime | None = None
+
+    def record(self, fetched: datetime, changed: bool) -> None:
+        """Record a payload fetched at `fetched`, and whether its content changed."""
+        if self.last_fetch is not None and fetched <= self.last_fetch:
+            # Served from the response cache; nothing new was observed.
+            return
+        if changed and self.last_fetch is not None:
+            window = fetched - self.last_fetch
+            middle = self.last_fetch + window / 2
+            hours = max(window.total_seconds() / 3600, 0.25)
+            self._samples.append((middle.hour * 60 + middle.minute, 1 / hours))
+        if changed:
+            self.last_change = fetched
+        self.last_fetch = fetched
+
+    @property
+    def expected_minute(self) -> int | None:
+        """Return the expected publication time in minutes after local midnight."""
+        if len(self._samples) < MIN_PUBLICATION_SAMPLES:
+            return None
+        x = y = 0.0
+        for minute, weight in self._samples:
+            angle = 2 * math.pi * minute / _MINUTES_PER_DAY
+            x += weight * math.cos(angle)
+            y += weight * math.sin(angle)
+        if not x and not y:
+            return None
+        angle = math.atan2(y, x) % (2 * math.pi)
+        return round(angle * _MINUTES_PER_DAY / (2 * math.pi)) % _MINUTES_PER_DAY
+
+    def next_interval(self, now: datetime, fallback: timedelta) -> timedelta:
+        """Return the delay until the next refresh.
+
+        Returns `fallback` until the publication time is known. After that,
+        the next refresh follows the next expected publication, retries
+        every LATE_RETRY while a publication is overdue, and waits at most
+        MAX_INTERVAL.
+        """
+        minute = self.expected_minute
+        if minute is None:
+            return fallback
+        published = now.replace(
+            hour=minute // 60, minute=minute % 60, second=0, microsecond=0
+        )
+        if published > now:
+            published -= timedelta(days=1)
+        seen = (
+            self.last_change is not None
+            and self.last_change >= published - PUBLICATION_TOLERANCE
+        )
+        if not seen and now - published < PUBLICATION_TOLERANCE:
+            due = published + PUBLICATION_MARGIN - now
+            delay = due if due > timedelta(0) else LATE_RETRY
+        else:
+            delay = published + timedelta(days=1) + PUBLICATION_MARGIN - now
+        return max(MIN_INTERVAL, min(delay, MAX_INTERVAL))
+
+    def to_storage(self) -> dict:
+        """Return the learned state in the form persisted with the payload."""
+        return {
+            "samples": [list(sample) for sample in self._samples],
+            "last_fetch": self.last_fetch.isoformat() if self.last_fetch else None,
+            "last_change": self.last_change.isoformat() if self.last_change else None,
+        }
+
+    def restore(self, stored: dict) -> None:
+        """Restore the state saved by to_storage(), skipping malformed parts."""
+        for sample in stored.get("samples") or ():
+            try:
+                minute, weight = sample
+                self._samples.append((float(minute), float(weight)))
+            except (TypeError, ValueError):
+                continue
+        for attr in ("last_fetch", "last_change"):
+            value = stored.get(attr)
+            parsed = dt_util.parse_datetime(value) if isinstance(value, str) else None
+            if parsed is not None and parsed.tzinfo is not None:
+                setattr(self, attr, parsed)
+
+    def as_dict(self) -> dict:
+        """Return the schedule's state for diagnostics."""
+        minute = self.expected_minute
+        return {
+            "samples": len(self._samples),
+            "expected_publication": f"{minute // 60:02d}:{minute % 60:02d}"
+            if minute is not None
+            else None,
+            "last_change": self.last_change.isoformat() if self.last_change else None,
+        }
+
+
+class SeasonTracker:
+    """Tells whether a location is outside the pollen season."""
+
+    def __init__(self, country: str) -> None:
+        self.country = country
+        self.quiet_refreshes = 0
+
+    def record(self, quiet: bool) -> None:
+        """Record a refresh, and whether all its levels were 0."""
+        self.quiet_refreshes = self.quiet_refreshes + 1 if quiet else 0
+
+    def in_calendar_season(self, today: date) -> bool:
+        """Return True if `today` is within the country's usual season."""
+        season = SEASON_CALENDARS.get(self.country)
+        return season is not None and season[0] <= today.month <= season[1]
+
+    def is_off_season(self, today: date) -> bool:
+        """Return True if refreshes can slow down to OFF_SEASON_INTERVAL."""
+        return self.quiet_refreshes >= OFF_SEASON_REFRESHES and (
+            not self.in_calendar_season(today)
+        )
+
+    def as_dict(self) -> dict:
+        """Return the tracker's state for diagnostics."""
+        today = dt_util.now().date()
+        return {
+            "quiet_refreshes": self.quiet_refreshes,
+            "in_calendar_season": self.in_calendar_season(today),
+            "off_season": self.is_off_season(today),
+        }
+
+
+class RefreshScheduler:
+    """Spreads the refreshes of all grid cells and limits concurrent fetches."""
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        # Coordinators registered per cell key
+        self._users: dict[str, int] = {}
+        self.fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    def register(self, key: str) -> None:
+        """Add a coordinator by its grid cell key."""
+        self._users[key] = self._users.get(key, 0) + 1
+        if key not in self._keys:
+            self._keys.append(key)
+            self._keys.sort()
+
+    def unregister(self, key: str) -> None:
+        """Remove a coordinator by its grid cell key."""
+        users = self._users.get(key, 0) - 1
+        if users > 0:
+            self._users[key] = users
+            return
+        self._users.pop(key, None)
+        if key in self._keys:
+            self._keys.remove(key)
+
+    def phase(self, key: str) -> float:
+        """Return the cell's phase as a fraction of any interval.
+
+        Registered keys get an even share each, in key order, and a
+        deterministic offset within their share from a digest of the key.
+        """
+        jitter = int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:8], 16) / 2**32
+        if key not in self._keys:
+            return jitter
+        return (self._keys.index(key) + jitter) / len(self._keys)
+
+    def align(self, key: str, interval: timedelta, now: datetime) -> timedelta:
+        """Return a delay close to `interval` that ends on the key's phase.
+
+        Refreshes then fall on the same offset within every interval, and
+        the delay lies between half and one and a half intervals.
+        """
+        period = interval.total_seconds()
+        offset = self.phase(key) * period
+        timestamp = now.timestamp()
+        steps = math.ceil((timestamp + period / 2 - offset) / period)
+        return timedelta(seconds=steps * period + offset - timestamp)
+
+    def spread(self, key: str, delay: timedelta, window: timedelta) -> timedelta:
+        """Return `delay` plus the key's share of `window`."""
+        return delay + window * self.phase(key)
+
+    def as_dict(self, key: str) -> dict:
+        """Return the scheduler's state for diagnostics."""
+        return {
+            "cells": len(self._keys),
+            "coordinators": sum(self._users.values()),
+            "phase": round(self.phase(key), 4),
+            "max_concurrent_fetches": MAX_CONCURRENT_FETCHES,
+        }
+
+
+def get_refresh_scheduler(hass) -> RefreshScheduler:
+    """Return the refresh scheduler shared by all entries of this integration."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_SCHEDULER] = RefreshScheduler()
+    return scheduler
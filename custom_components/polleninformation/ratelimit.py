@@ -0,0 +1,117 @@
+"""Per-API-key rate limiting for polleninformation.at requests.
+
+Every request sent through api.py first takes a token from the bucket of its
+API key. All entries using the same key therefore share one request budget,
+and requests over that budget wait in line instead of being dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+
+from .const import DEFAULT_RATE_BURST, DEFAULT_RATE_LIMIT
+
+
+class TokenBucket:
+    """Async token bucket with FIFO waiting and wait-time statistics."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens held at once.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.queue_depth = 0
+        self.acquired = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.total_wait = 0.0
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Change rate and burst; tokens already held are kept up to the new burst."""
+        self._refill()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, float(burst))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def async_acquire(self) -> float:
+        """Wait for a token and return the number of seconds waited."""
+        started = time.monotonic()
+        self.queue_depth += 1
+        try:
+            # asyncio.Lock wakes waiters in FIFO order, so requests are
+            # served in the order they arrived.
+            async with self._lock:
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self.queue_depth -= 1
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.last_wait = waited
+        self.max_wait = max(self.max_wait, waited)
+        self.total_wait += waited
+        return waited
+
+    def as_dict(self) -> dict:
+        """Return the bucket's configuration and statistics."""
+        self._refill()
+        return {
+            "rate_per_minute": self.rate * 60,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self.queue_depth,
+            "acquired": self.acquired,
+            "last_wait": round(self.last_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "avg_wait": round(self.total_wait / self.acquired, 3)
+            if self.acquired
+            else 0.0,
+        }
+
+
+# Process-wide buckets keyed by a digest of the API key
+_LIMITERS: dict[str, TokenBucket] = {}
+
+
+def _key_digest(apikey: str) -> str:
+    return hashlib.sha256(apikey.strip().encode("utf-8")).hexdigest()[:8]
+
+
+def get_rate_limiter(apikey: str) -> TokenBucket:
+    """Return the token bucket shared by all requests using `apikey`."""
+    digest = _key_digest(apikey)
+    limiter = _LIMITERS.get(digest)
+    if limiter is None:
+        limiter = _LIMITERS[digest] = TokenBucket(
+            DEFAULT_RATE_LIMIT / 60, DEFAULT_RATE_BURST
+        )
+    return limiter
+
+
+def configure_rate_limiter(apikey: str, rate_per_minute: float, burst: int) -> None:
+    """Set the rate (requests per minute) and burst for an API key."""
+    get_rate_limiter(apikey).configure(rate_per_minute / 60, burst)
+
+
+def get_rate_limiter_stats(apikey: str) -> dict:
+    """Return queue depth and wait statistics for an API key's bucket."""
+    return get_rate_limiter(apikey).as_dict()
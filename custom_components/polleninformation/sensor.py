@@ -13,21 +13,31 @@ See official API documentation: https://www.polleninformation.at/en/data-interfa
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DEFAULT_LANG, DOMAIN
-from .const_levels import LEVELS
-from .utils import (
-    async_get_language_block,
-    get_allergen_info_by_latin,
-    normalize,
-    slugify,
+from homeassistant.util import dt as dt_util
+
+from .clock import async_track_hourly_tick, async_track_local_midnight
+from .const import (
+    CONF_FORECAST_ATTRIBUTES,
+    DEFAULT_FORECAST_ATTRIBUTES,
+    DEFAULT_LANG,
+    DOMAIN,
 )
+from .const_levels import LEVELS
+from .metrics import PERCENTILES, get_request_metrics
+from .model import MISSING, AllergenForecast, PollenForecast
+from .utils import normalize
 
 DEBUG = True
 _LOGGER = logging.getLogger(__name__)
@@ -54,18 +64,29 @@ ALLERGEN_ICON_MAP = {
     "willow": "mdi:tree",
 }
 
+# Attributes kept out of the recorder: the forecast lists are large and the
+# rest never changes for an entity.
+UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "forecast",
+        "levels_current",
+        "levels_en",
+        "name_en",
+        "name_la",
+        "allergen_slug",
+        "location_title",
+        "location_slug",
+        "type",
+        "icon",
+    }
+)
+
 KNOWN_ALLERGEN_SLUGS = set(ALLERGEN_ICON_MAP.keys()) - {"default"} | {
     "allergy_risk",
     "allergy_risk_hourly",
 }
 
 
-def capitalize_first(s: str) -> str:
-    if not s:
-        return s
-    return s[0].upper() + s[1:]
-
-
 def extract_allergen_slug_from_unique_id(unique_id: str) -> str | None:
     """Extract allergen slug from unique_id by matching known suffixes.
 
@@ -102,6 +123,13 @@ def pollen_forecast_for_allergen(
     return out
 
 
+def format_last_updated(coordinator) -> str | None:
+    """Return when the coordinator's data was fetched, for the attributes."""
+    if coordinator.last_updated is None:
+        return None
+    return coordinator.last_updated.strftime("%Y-%m-%d %H:%M:%S")
+
+
 def scale_allergy_risk(value: Any) -> int | None:
     try:
         return int(round(value / 2.5))
@@ -126,15 +154,16 @@ async def async_setup_entry(hass, entry, async_add_entities):
         if e.domain == "sensor" and not e.disabled
     }
 
-    has_data = coordinator.data is not None
-    contamination = coordinator.data.get("contamination", []) if has_data else []
-    is_data_empty = len(contamination) == 0
+    forecast: PollenForecast | None = coordinator.data
+    has_data = forecast is not None
+    allergens = forecast.allergens if has_data else ()
+    is_data_empty = len(allergens) == 0
 
     if DEBUG:
         _LOGGER.debug(
             "Polleninformation: has_data=%s, contamination_count=%s, existing_entities=%s",
             has_data,
-            len(contamination),
+            len(allergens),
             len(existing_unique_ids),
         )
 
@@ -154,9 +183,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
         lon_str = f"{lon:.4f}" if lon is not None else "?"
         location_title = f"{country_name} ({lat_str}, {lon_str})"
     location_slug = normalize(location_title)
+    forecast_attributes = entry.options.get(
+        CONF_FORECAST_ATTRIBUTES, DEFAULT_FORECAST_ATTRIBUTES
+    )
 
-    language_block_current = await async_get_language_block(hass, lang)
-    language_block_en = await async_get_language_block(hass, "en")
     levels_current = LEVELS.get(
         lang, LEVELS.get("en", ["none", "low", "moderate", "high", "very high"])
     )
@@ -165,86 +195,79 @@ async def async_setup_entry(hass, entry, async_add_entities):
     entities: list[SensorEntity] = []
     new_unique_ids: set[str] = set()
 
-    for item in contamination:
-        poll_title_full = item.get("poll_title", "<unknown>")
-        poll_title_local = capitalize_first(poll_title_full.split("(", 1)[0].strip())
-        latin = None
-        if "(" in poll_title_full and ")" in poll_title_full:
-            latin = poll_title_full.split("(", 1)[1].split(")", 1)[0].strip()
-        if not latin:
-            for allergen in language_block_current.get("poll_titles", []):
-                if allergen.get("name") == poll_title_local:
-                    latin = allergen.get("latin")
-                    break
-        allergen_en_obj = (
-            get_allergen_info_by_latin(latin, language_block_en) if latin else None
-        )
-        allergen_en = allergen_en_obj["name"] if allergen_en_obj else poll_title_local
-        allergen_la = latin if latin else ""
-        slug_en = slugify(allergen_en) if allergen_en else slugify(poll_title_local)
-        icon = ALLERGEN_ICON_MAP.get(slug_en, ALLERGEN_ICON_MAP["default"])
-
+    for allergen in allergens:
+        icon = ALLERGEN_ICON_MAP.get(allergen.slug, ALLERGEN_ICON_MAP["default"])
         sensor = PolleninformationSensor(
             coordinator=coordinator,
             sensor_type="pollen",
-            allergen_name=poll_title_local,
-            allergen_en=allergen_en,
-            allergen_slug=slug_en,
-            allergen_latin=allergen_la,
+            allergen_name=allergen.name,
+            allergen_en=allergen.name_en,
+            allergen_slug=allergen.slug,
+            allergen_latin=allergen.latin,
             levels_current=levels_current,
             levels_en=levels_en,
             location_slug=location_slug,
             location_title=location_title,
             icon=icon,
+            forecast_attributes=forecast_attributes,
         )
         entities.append(sensor)
         if sensor.unique_id:
             new_unique_ids.add(sensor.unique_id)
 
     # Allergy risk daily sensor - only if contamination has data (otherwise allergyrisk is meaningless)
-    allergyrisk = (
-        coordinator.data.get("allergyrisk", {})
-        if has_data and not is_data_empty
-        else {}
-    )
-    if allergyrisk:
+    if not is_data_empty and len(forecast.risk_daily):
         sensor = AllergyRiskSensor(
             coordinator=coordinator,
-            allergyrisk=allergyrisk,
             levels_current=levels_current,
             location_slug=location_slug,
             location_title=location_title,
+            forecast_attributes=forecast_attributes,
         )
         entities.append(sensor)
         if sensor.unique_id:
             new_unique_ids.add(sensor.unique_id)
 
     # Allergy risk hourly sensor - only if contamination has data (otherwise allergyrisk is meaningless)
-    allergyrisk_hourly = (
-        coordinator.data.get("allergyrisk_hourly", {})
-        if has_data and not is_data_empty
-        else {}
-    )
-    if allergyrisk_hourly:
+    if not is_data_empty and forecast.risk_hourly:
         sensor = AllergyRiskHourlySensor(
             coordinator=coordinator,
-            allergyrisk_hourly=allergyrisk_hourly,
             levels_current=levels_current,
             location_slug=location_slug,
             location_title=location_title,
+            forecast_attributes=forecast_attributes,
         )
         entities.append(sensor)
         if sensor.unique_id:
             new_unique_ids.add(sensor.unique_id)
 
-    # Recreate stale entities from registry when API returns empty data
-    stale_since = datetime.now().isoformat() if is_data_empty else None
-    if is_data_empty and existing_unique_ids:
-        _LOGGER.warning(
-            "API returned empty data for %s, recreating %d entities as stale",
-            location_title,
-            len(existing_unique_ids),
+    # API response time diagnostic sensor, disabled by default
+    entities.append(
+        ApiResponseTimeSensor(
+            coordinator=coordinator,
+            location_slug=location_slug,
+            location_title=location_title,
         )
+    )
+
+    # Recreate entities from the registry when there are no allergens: either
+    # the API returned empty data and they are stale, or a background startup
+    # has not fetched any data yet.
+    is_stale = has_data and is_data_empty
+    stale_since = dt_util.now().isoformat() if is_stale else None
+    if is_data_empty and existing_unique_ids:
+        if is_stale:
+            _LOGGER.warning(
+                "API returned empty data for %s, recreating %d entities as stale",
+                location_title,
+                len(existing_unique_ids),
+            )
+        else:
+            _LOGGER.debug(
+                "No data yet for %s, restoring %d entities from the registry",
+                location_title,
+                len(existing_unique_ids),
+            )
         for unique_id in existing_unique_ids:
             if unique_id in new_unique_ids:
                 continue
@@ -254,22 +277,22 @@ async def async_setup_entry(hass, entry, async_add_entities):
             if allergen_slug == "allergy_risk":
                 sensor = AllergyRiskSensor(
                     coordinator=coordinator,
-                    allergyrisk={},
                     levels_current=levels_current,
                     location_slug=location_slug,
                     location_title=location_title,
-                    is_stale=True,
+                    is_stale=is_stale,
                     stale_since=stale_since,
+                    forecast_attributes=forecast_attributes,
                 )
             elif allergen_slug == "allergy_risk_hourly":
                 sensor = AllergyRiskHourlySensor(
                     coordinator=coordinator,
-                    allergyrisk_hourly={},
                     levels_current=levels_current,
                     location_slug=location_slug,
                     location_title=location_title,
-                    is_stale=True,
+                    is_stale=is_stale,
                     stale_since=stale_since,
+                    forecast_attributes=forecast_attributes,
                 )
             else:
                 allergen_en = allergen_slug.replace("_", " ").title()
@@ -288,17 +311,73 @@ async def async_setup_entry(hass, entry, async_add_entities):
                     location_slug=location_slug,
                     location_title=location_title,
                     icon=icon,
-                    is_stale=True,
+                    is_stale=is_stale,
                     stale_since=stale_since,
+                    forecast_attributes=forecast_attributes,
                 )
             entities.append(sensor)
             if sensor.unique_id:
                 new_unique_ids.add(sensor.unique_id)
 
-    async_add_entities(entities, update_before_add=True)
+    # Entities read the coordinator's data; an update before adding would only
+    # trigger another refresh and block platform setup on the API.
+    async_add_entities(entities)
+
+
+class MemoizedAttributesMixin:
+    """Reuse extra_state_attributes until the data or the local hour changes.
+
+    Subclasses build their attributes in _build_attributes(). The result is
+    kept per (coordinator data generation, fetch time, local date, hour), so
+    repeated state writes within that window return the same dict.
+
+    States are also rewritten from the data already held when the local
+    time moves them on: every hour for entities with an hourly state, at
+    local midnight for the others.
+    """
+
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+    _forecast_attributes = True
+    _hourly_state = False
+    _attrs_key: tuple | None = None
+    _attrs: dict[str, Any]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        track = (
+            async_track_hourly_tick
+            if self._hourly_state
+            else async_track_local_midnight
+        )
+        self.async_on_remove(track(self.hass, self._async_on_clock))
 
+    @callback
+    def _async_on_clock(self, now: datetime) -> None:
+        if self.coordinator.data is not None:
+            self.async_write_ha_state()
 
-class PolleninformationSensor(CoordinatorEntity, SensorEntity):
+    def _build_attributes(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        now = dt_util.now()
+        key = (
+            self.coordinator.data_generation,
+            self.coordinator.last_updated,
+            now.date(),
+            now.hour,
+        )
+        if key != self._attrs_key:
+            self._attrs = self._build_attributes()
+            if not self._forecast_attributes:
+                # Forecasts are available through polleninformation.get_forecasts
+                self._attrs.pop("forecast", None)
+            self._attrs_key = key
+        return self._attrs
+
+
+class PolleninformationSensor(MemoizedAttributesMixin, CoordinatorEntity, SensorEntity):
     """Pollen allergen sensor."""
 
     _attr_has_entity_name = True
@@ -318,6 +397,7 @@ class PolleninformationSensor(CoordinatorEntity, SensorEntity):
         icon: str,
         is_stale: bool = False,
         stale_since: str | None = None,
+        forecast_attributes: bool = True,
     ) -> None:
         super().__init__(coordinator)
         self.sensor_type = sensor_type
@@ -331,6 +411,7 @@ class PolleninformationSensor(CoordinatorEntity, SensorEntity):
         self._location_title = location_title
         self._is_stale = is_stale
         self._stale_since = stale_since
+        self._forecast_attributes = forecast_attributes
 
         self._attr_name = allergen_name
         self._attr_unique_id = f"polleninformation_{location_slug}_{allergen_slug}"
@@ -351,57 +432,52 @@ class PolleninformationSensor(CoordinatorEntity, SensorEntity):
         # Stale/empty data still shows as available but with state "unknown"
         return self.coordinator.last_update_success is not False
 
+    def _allergen(self) -> AllergenForecast | None:
+        """Return this allergen's record from the coordinator's forecast."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get_allergen(self._allergen_slug)
+
     @property
     def native_value(self) -> str | None:
-        if not self.coordinator.data:
-            return None
-        contamination = self.coordinator.data.get("contamination", [])
-        found = None
-        for item in contamination:
-            poll_title = item.get("poll_title", "").split("(", 1)[0].strip()
-            if poll_title.lower() == self._allergen_name.lower():
-                found = item
-                break
-        if not found:
+        allergen = self._allergen()
+        if allergen is None:
             return None
-        raw_val = found.get("contamination_1", 0)
+        level = allergen.level(self.coordinator.data.day_offset())
         try:
-            return self._levels_current[raw_val]
+            return self._levels_current[level]
         except (IndexError, TypeError):
             return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        if not self.coordinator.data:
+    def _build_attributes(self) -> dict[str, Any]:
+        if self.coordinator.data is None:
             attrs: dict[str, Any] = {}
             if self._is_stale:
                 attrs["data_stale"] = True
                 attrs["stale_since"] = self._stale_since
             return attrs
 
-        contamination = self.coordinator.data.get("contamination", [])
+        allergen = self._allergen()
         forecast = []
-        base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        for item in contamination:
-            poll_title = item.get("poll_title", "").split("(", 1)[0].strip()
-            if poll_title.lower() == self._allergen_name.lower():
-                for day in range(1, 5):
-                    val = item.get(f"contamination_{day}", 0)
-                    level_name = (
-                        self._levels_current[val]
-                        if isinstance(val, int) and val < len(self._levels_current)
-                        else str(val)
-                    )
-                    forecast.append(
-                        {
-                            "time": (base_date + timedelta(days=day - 1)).strftime(
-                                "%Y-%m-%dT%H:%M:%S"
-                            ),
-                            "level": val,
-                            "level_name": level_name,
-                        }
-                    )
-                break
+        base_date = dt_util.start_of_local_day()
+        if allergen is not None:
+            offset = self.coordinator.data.day_offset()
+            for day in range(len(allergen.levels) - offset):
+                val = allergen.level(offset + day)
+                level_name = (
+                    self._levels_current[val]
+                    if val is not None and val < len(self._levels_current)
+                    else None
+                )
+                forecast.append(
+                    {
+                        "time": (base_date + timedelta(days=day)).strftime(
+                            "%Y-%m-%dT%H:%M:%S"
+                        ),
+                        "level": val,
+                        "level_name": level_name,
+                    }
+                )
 
         today_raw = forecast[0] if forecast else None
         tomorrow_raw = forecast[1] if len(forecast) > 1 else None
@@ -425,7 +501,7 @@ class PolleninformationSensor(CoordinatorEntity, SensorEntity):
             "levels_current": self._levels_current,
             "levels_en": self._levels_en,
             "update_success": self.coordinator.data is not None,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "last_updated": format_last_updated(self.coordinator),
         }
         if self._is_stale:
             attrs["data_stale"] = True
@@ -433,7 +509,7 @@ class PolleninformationSensor(CoordinatorEntity, SensorEntity):
         return attrs
 
 
-class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
+class AllergyRiskSensor(MemoizedAttributesMixin, CoordinatorEntity, SensorEntity):
     """Daily allergy risk sensor."""
 
     _attr_has_entity_name = True
@@ -441,20 +517,20 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
     def __init__(
         self,
         coordinator,
-        allergyrisk: dict,
         levels_current: list,
         location_slug: str,
         location_title: str,
         is_stale: bool = False,
         stale_since: str | None = None,
+        forecast_attributes: bool = True,
     ) -> None:
         super().__init__(coordinator)
-        self._allergyrisk = allergyrisk
         self._levels_current = levels_current
         self._location_slug = location_slug
         self._location_title = location_title
         self._is_stale = is_stale
         self._stale_since = stale_since
+        self._forecast_attributes = forecast_attributes
 
         self._attr_name = "Allergy risk"
         self._attr_unique_id = f"polleninformation_{location_slug}_allergy_risk"
@@ -469,19 +545,27 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         return self.coordinator.last_update_success is not False
 
+    def _forecast(self) -> PollenForecast | None:
+        """Return the coordinator's forecast if it has daily risk values."""
+        forecast = self.coordinator.data
+        if self._is_stale or forecast is None or not len(forecast.risk_daily):
+            return None
+        return forecast
+
     @property
     def native_value(self) -> str | None:
-        if self._is_stale or not self._allergyrisk:
+        forecast = self._forecast()
+        if forecast is None:
             return None
-        value = self._allergyrisk.get("allergyrisk_1", None)
+        value = forecast.risk(forecast.day_offset())
         scaled = scale_allergy_risk(value) if value is not None else None
         if scaled is not None and scaled < len(self._levels_current):
             return self._levels_current[scaled]
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        if self._is_stale or not self._allergyrisk:
+    def _build_attributes(self) -> dict[str, Any]:
+        forecast_data = self._forecast()
+        if forecast_data is None:
             attrs: dict[str, Any] = {
                 "location_title": self._location_title,
                 "location_slug": self._location_slug,
@@ -493,9 +577,10 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
             return attrs
 
         forecast = []
-        base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        for day in range(1, 5):
-            value_raw = self._allergyrisk.get(f"allergyrisk_{day}", None)
+        base_date = dt_util.start_of_local_day()
+        offset = forecast_data.day_offset()
+        for day in range(len(forecast_data.risk_daily) - offset):
+            value_raw = forecast_data.risk(offset + day)
             scaled = scale_allergy_risk(value_raw) if value_raw is not None else None
             level_name = (
                 self._levels_current[scaled]
@@ -504,7 +589,7 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
             )
             forecast.append(
                 {
-                    "time": (base_date + timedelta(days=day - 1)).strftime(
+                    "time": (base_date + timedelta(days=day)).strftime(
                         "%Y-%m-%dT%H:%M:%S"
                     ),
                     "level": scaled,
@@ -512,7 +597,7 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
                     "level_raw": value_raw,
                 }
             )
-        raw_value = self._allergyrisk.get("allergyrisk_1", None)
+        raw_value = forecast_data.risk(offset)
         scaled_today = scale_allergy_risk(raw_value) if raw_value is not None else None
         return {
             "named_state": self.native_value,
@@ -523,32 +608,33 @@ class AllergyRiskSensor(CoordinatorEntity, SensorEntity):
             "location_slug": self._location_slug,
             "attribution": "Austrian Pollen Information Service",
             "update_success": self.coordinator.data is not None,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "last_updated": format_last_updated(self.coordinator),
         }
 
 
-class AllergyRiskHourlySensor(CoordinatorEntity, SensorEntity):
+class AllergyRiskHourlySensor(MemoizedAttributesMixin, CoordinatorEntity, SensorEntity):
     """Hourly allergy risk sensor."""
 
     _attr_has_entity_name = True
+    _hourly_state = True
 
     def __init__(
         self,
         coordinator,
-        allergyrisk_hourly: dict,
         levels_current: list,
         location_slug: str,
         location_title: str,
         is_stale: bool = False,
         stale_since: str | None = None,
+        forecast_attributes: bool = True,
     ) -> None:
         super().__init__(coordinator)
-        self._allergyrisk_hourly = allergyrisk_hourly
         self._levels_current = levels_current
         self._location_slug = location_slug
         self._location_title = location_title
         self._is_stale = is_stale
         self._stale_since = stale_since
+        self._forecast_attributes = forecast_attributes
 
         self._attr_name = "Allergy risk hourly"
         self._attr_unique_id = f"polleninformation_{location_slug}_allergy_risk_hourly"
@@ -563,22 +649,27 @@ class AllergyRiskHourlySensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         return self.coordinator.last_update_success is not False
 
+    def _forecast(self) -> PollenForecast | None:
+        """Return the coordinator's forecast if it has hourly risk values."""
+        forecast = self.coordinator.data
+        if self._is_stale or forecast is None or not forecast.risk_hourly:
+            return None
+        return forecast
+
     @property
     def native_value(self) -> str | None:
-        if self._is_stale or not self._allergyrisk_hourly:
+        forecast = self._forecast()
+        if forecast is None:
             return None
-        now_hour = datetime.now().hour
-        values = self._allergyrisk_hourly.get("allergyrisk_hourly_1", [])
-        if 0 <= now_hour < len(values):
-            raw = values[now_hour]
-            scaled = scale_allergy_risk(raw)
-            if scaled is not None and scaled < len(self._levels_current):
-                return self._levels_current[scaled]
+        raw = forecast.hourly_risk(forecast.day_offset(), dt_util.now().hour)
+        scaled = scale_allergy_risk(raw) if raw is not None else None
+        if scaled is not None and scaled < len(self._levels_current):
+            return self._levels_current[scaled]
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        if self._is_stale or not self._allergyrisk_hourly:
+    def _build_attributes(self) -> dict[str, Any]:
+        forecast_data = self._forecast()
+        if forecast_data is None:
             attrs: dict[str, Any] = {
                 "location_title": self._location_title,
                 "location_slug": self._location_slug,
@@ -589,15 +680,16 @@ class AllergyRiskHourlySensor(CoordinatorEntity, SensorEntity):
                 attrs["stale_since"] = self._stale_since
             return attrs
 
-        base_time = datetime.now(timezone.utc).replace(
-            minute=0, second=0, microsecond=0
-        )
+        # Hourly values start at local midnight of the day they belong to
+        base_time = dt_util.start_of_local_day()
         forecast = []
-        for day in range(1, 5):
-            values = self._allergyrisk_hourly.get(f"allergyrisk_hourly_{day}", [])
-            for hour, raw in enumerate(values):
-                dt = base_time + timedelta(days=day - 1, hours=hour)
-                scaled = scale_allergy_risk(raw)
+        offset = forecast_data.day_offset()
+        hourly = forecast_data.risk_hourly[offset:] if self._forecast_attributes else ()
+        for day, values in enumerate(hourly):
+            for hour, value in enumerate(values):
+                raw = value if value != MISSING else None
+                dt = base_time + timedelta(days=day, hours=hour)
+                scaled = scale_allergy_risk(raw) if raw is not None else None
                 named = (
                     self._levels_current[scaled]
                     if scaled is not None and scaled < len(self._levels_current)
@@ -612,9 +704,7 @@ class AllergyRiskHourlySensor(CoordinatorEntity, SensorEntity):
                     }
                 )
 
-        now_hour = datetime.now().hour
-        values_today = self._allergyrisk_hourly.get("allergyrisk_hourly_1", [])
-        raw_now = values_today[now_hour] if 0 <= now_hour < len(values_today) else None
+        raw_now = forecast_data.hourly_risk(offset, dt_util.now().hour)
         scaled_now = scale_allergy_risk(raw_now) if raw_now is not None else None
         named_now = (
             self._levels_current[scaled_now]
@@ -630,5 +720,51 @@ class AllergyRiskHourlySensor(CoordinatorEntity, SensorEntity):
             "location_slug": self._location_slug,
             "attribution": "Austrian Pollen Information Service",
             "update_success": self.coordinator.data is not None,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "last_updated": format_last_updated(self.coordinator),
         }
+
+
+class ApiResponseTimeSensor(CoordinatorEntity, SensorEntity):
+    """95th percentile response time of the API for the entry's country."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator,
+        location_slug: str,
+        location_title: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._location_slug = location_slug
+        self._location_title = location_title
+
+        self._attr_name = "API response time"
+        self._attr_unique_id = f"polleninformation_{location_slug}_api_response_time"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"{location_slug}")},
+            "name": f"Polleninformation ({location_title})",
+            "manufacturer": "Austrian Pollen Information Service",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        return get_request_metrics(self.coordinator.country).percentile("total", 95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = get_request_metrics(self.coordinator.country)
+        attrs: dict[str, Any] = {
+            f"{field}_p{percentile}": metrics.percentile(field, percentile)
+            for field in ("total", "ttfb")
+            for percentile in PERCENTILES
+        }
+        attrs["samples"] = len(metrics.samples)
+        attrs["country"] = self.coordinator.country
+        return attrs
@@ -0,0 +1,101 @@
+"""Services for polleninformation.at integration.
+
+polleninformation.get_forecasts returns the daily and hourly forecasts of
+one or more sensors as response data, read from the coordinator's parsed
+forecast. Dashboards and automations can use it instead of the forecast
+attributes, which can then be turned off per entry.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import voluptuous as vol
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .model import MISSING, PollenForecast
+from .sensor import extract_allergen_slug_from_unique_id, scale_allergy_risk
+
+SERVICE_GET_FORECASTS = "get_forecasts"
+
+GET_FORECASTS_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_ids})
+
+
+def _scaled(values) -> list[int | None]:
+    return [scale_allergy_risk(v) if v != MISSING else None for v in values]
+
+
+def _raw(values) -> list[int | None]:
+    return [v if v != MISSING else None for v in values]
+
+
+def forecast_series(forecast: PollenForecast, slug: str, start: date) -> dict:
+    """Return the compact forecast of one sensor.
+
+    Daily series hold one value per day from `start`; hourly series hold one
+    list of values per day, indexed by local hour. Missing values are None.
+    Days of the forecast before `start` are left out.
+    """
+    offset = forecast.day_offset(start)
+    series: dict = {"start": start.isoformat()}
+    if slug == "allergy_risk":
+        series["type"] = "allergy_risk"
+        series["daily"] = _scaled(forecast.risk_daily[offset:])
+        series["daily_raw"] = _raw(forecast.risk_daily[offset:])
+    elif slug == "allergy_risk_hourly":
+        series["type"] = "allergy_risk_hourly"
+        series["hourly"] = [_scaled(day) for day in forecast.risk_hourly[offset:]]
+        series["hourly_raw"] = [_raw(day) for day in forecast.risk_hourly[offset:]]
+    else:
+        allergen = forecast.get_allergen(slug)
+        series["type"] = "pollen"
+        series["allergen"] = slug
+        series["daily"] = _raw(allergen.levels[offset:]) if allergen else []
+    return series
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_get_forecasts(call: ServiceCall) -> ServiceResponse:
+        ent_reg = er.async_get(hass)
+        start = dt_util.now().date()
+        response: dict = {}
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            entity = ent_reg.async_get(entity_id)
+            slug = (
+                extract_allergen_slug_from_unique_id(entity.unique_id)
+                if entity is not None and entity.platform == DOMAIN
+                else None
+            )
+            if slug is None:
+                raise ServiceValidationError(
+                    f"{entity_id} is not a polleninformation forecast sensor"
+                )
+            coordinator = hass.data.get(DOMAIN, {}).get(entity.config_entry_id)
+            if coordinator is None or coordinator.data is None:
+                response[entity_id] = {}
+                continue
+            response[entity_id] = forecast_series(coordinator.data, slug, start)
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECASTS,
+        async_get_forecasts,
+        schema=GET_FORECASTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -1,11 +1,14 @@
 """custom_components/polleninformation/utils.py"""
 
 import json
+import math
 import os
 import re
 import unicodedata
+from bisect import bisect_right
 
 import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     COUNTRY_DISPLAY_NAMES,
@@ -15,13 +18,72 @@ from .const import (
 )
 
 LANGUAGE_MAP_FILE = os.path.join(os.path.dirname(__file__), "language_map.json")
+COUNTRY_GRID_FILE = os.path.join(os.path.dirname(__file__), "country_grid.json")
 
 
-async def async_get_country_code_from_latlon(hass, lat, lon):
+# Run-length encoded row of country_grid.json: "<count><CC>", "--" for no country
+_GRID_RUN_RE = re.compile(r"(\d+)([A-Z]{2}|--)")
+
+# Parsed country grid, loaded on first lookup
+_COUNTRY_GRID = None
+
+
+class CountryGrid:
+    """Offline lat/lon to country lookup over a regular grid.
+
+    Each row is kept as the start columns of its runs and their country
+    codes, so a lookup is one row index and a bisect.
+    """
+
+    __slots__ = ("_codes", "_starts", "cols", "lat_min", "lon_min", "step")
+
+    def __init__(self, data: dict) -> None:
+        self.lat_min = data["lat_min"]
+        self.lon_min = data["lon_min"]
+        self.step = data["step"]
+        self.cols = data["cols"]
+        self._starts = []
+        self._codes = []
+        for row in data["rows"]:
+            starts, codes, col = [], [], 0
+            for count, code in _GRID_RUN_RE.findall(row):
+                starts.append(col)
+                codes.append(None if code == "--" else code)
+                col += int(count)
+            self._starts.append(starts)
+            self._codes.append(codes)
+
+    def lookup(self, lat: float, lon: float) -> str | None:
+        """Return the country code at lat/lon, or None outside the grid or at sea."""
+        row = math.floor((lat - self.lat_min) / self.step)
+        col = math.floor((lon - self.lon_min) / self.step)
+        if not (0 <= row < len(self._starts) and 0 <= col < self.cols):
+            return None
+        return self._codes[row][bisect_right(self._starts[row], col) - 1]
+
+
+def _sync_load_country_grid():
+    """Load and parse the bundled country grid (blocking)."""
+    global _COUNTRY_GRID
+    if _COUNTRY_GRID is None:
+        with open(COUNTRY_GRID_FILE, encoding="utf-8") as f:
+            _COUNTRY_GRID = CountryGrid(json.load(f))
+    return _COUNTRY_GRID
+
+
+async def async_get_country_code_from_latlon(hass, lat, lon, allow_online=True):
     """
-    Get ISO 3166-1 alpha-2 country code from latitude/longitude using Nominatim API (OpenStreetMap).
+    Get ISO 3166-1 alpha-2 country code from latitude/longitude.
+    Resolved offline from the bundled country grid, which covers the supported
+    countries and their neighbours. Only outside the grid (or at sea) is
+    Nominatim (OpenStreetMap) asked, and only if allow_online is True.
     Returns country code in upper case, e.g. 'SE' for Sweden, or None if not found.
     """
+    grid = _COUNTRY_GRID or await hass.async_add_executor_job(_sync_load_country_grid)
+    country_code = grid.lookup(lat, lon)
+    if country_code or not allow_online:
+        return country_code
+
     url = "https://nominatim.openstreetmap.org/reverse"
     params = {
         "lat": lat,
@@ -31,11 +93,16 @@ async def async_get_country_code_from_latlon(hass, lat, lon):
         "addressdetails": 1,
     }
     headers = {"User-Agent": "Home Assistant Polleninformation Integration"}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, params=params, headers=headers, timeout=5) as resp:
+    session = async_get_clientsession(hass)
+    try:
+        async with session.get(
+            url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(5)
+        ) as resp:
             if resp.status == 200:
                 result = await resp.json()
                 return result.get("address", {}).get("country_code", "").upper()
+    except (aiohttp.ClientError, TimeoutError):
+        return None
     return None
 
 
@@ -322,3 +389,31 @@ def get_allergen_info_by_latin(latin, language_block):
         if allergen.get("latin") == latin:
             return allergen
     return None
+
+
+def localize_payload(data, language_block):
+    """
+    Return a copy of an API payload with allergen titles in another language.
+
+    Titles are rebuilt as "<name> (<latin>)" from the language block's entry
+    with the same poll_id. Where the block has no Latin name, the one from
+    the original title is kept, and a title without any is just "<name>".
+    Allergens missing from the block keep their title. Everything else in the
+    payload is language independent and shared with the original.
+    """
+    names = {
+        allergen.get("poll_id"): (allergen.get("name"), allergen.get("latin"))
+        for allergen in language_block.get("poll_titles", [])
+    }
+    contamination = []
+    for item in data.get("contamination", []):
+        name, latin = names.get(item.get("poll_id"), (None, None))
+        if not name:
+            contamination.append(item)
+            continue
+        if not latin:
+            _, _, rest = item.get("poll_title", "").partition("(")
+            latin = rest.split(")", 1)[0].strip()
+        title = f"{name} ({latin})" if latin else name
+        contamination.append({**item, "poll_title": title})
+    return {**data, "contamination": contamination}
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Micro-benchmark allergen lookups for a refresh burst.
+
+Simulates one refresh of many locations: every allergen sensor resolves its
+allergen twice (native_value and extra_state_attributes). Compares the old
+scan of the raw contamination list, splitting and lowercasing every poll
+title, with a scan of the parsed records and with the model's index. The
+one-off cost of parsing the payloads into the model is reported separately.
+
+Needs the integration's dependencies, e.g. after `source scripts/dev_init.sh`.
+
+    python scripts/benchmark_allergen_lookup.py [--allergens 20] [--locations 100]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from polleninformation.model import parse_forecast
+from polleninformation.utils import get_language_block_sync, slugify
+
+
+def make_payload(titles: list[dict], rng: random.Random) -> dict:
+    return {
+        "contamination": [
+            {
+                "poll_id": title["poll_id"],
+                "poll_title": f"{title['name']} ({title['latin']})",
+                **{f"contamination_{day}": rng.randint(0, 4) for day in range(1, 5)},
+            }
+            for title in titles
+        ],
+        "allergyrisk": {
+            f"allergyrisk_{day}": rng.randint(0, 10) for day in range(1, 5)
+        },
+        "allergyrisk_hourly": {
+            f"allergyrisk_hourly_{day}": [rng.randint(0, 10) for _ in range(24)]
+            for day in range(1, 5)
+        },
+    }
+
+
+def scan_lookup(data: dict, name: str) -> int | None:
+    """The lookup sensors did before the index: a scan per property read."""
+    name_lower = name.lower()
+    for item in data.get("contamination", []):
+        poll_title = item.get("poll_title", "").split("(", 1)[0].strip()
+        if poll_title.lower() == name_lower:
+            return item.get("contamination_1", 0)
+    return None
+
+
+def burst_scan(payloads: list[dict], names: list[str]) -> None:
+    for data in payloads:
+        for name in names:
+            scan_lookup(data, name)  # native_value
+            scan_lookup(data, name)  # extra_state_attributes
+
+
+def record_scan(forecast, slug: str):
+    for allergen in forecast.allergens:
+        if allergen.slug == slug:
+            return allergen
+    return None
+
+
+def burst_records(forecasts: list, slugs: list[str]) -> None:
+    for forecast in forecasts:
+        for slug in slugs:
+            record_scan(forecast, slug).level(0)  # native_value
+            record_scan(forecast, slug).level(0)  # extra_state_attributes
+
+
+def burst_index(forecasts: list, slugs: list[str]) -> None:
+    for forecast in forecasts:
+        for slug in slugs:
+            forecast.get_allergen(slug).level(0)  # native_value
+            forecast.get_allergen(slug).level(0)  # extra_state_attributes
+
+
+def parse_all(payloads: list[dict], blocks) -> list:
+    return [parse_forecast(data, *blocks) for data in payloads]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--allergens", type=int, default=20)
+    parser.add_argument("--locations", type=int, default=100)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    block_en = get_language_block_sync("en")
+    titles = [t for t in block_en.get("poll_titles", []) if t.get("latin")]
+    # Pad with made-up allergens if the language map has fewer than asked for.
+    titles += [
+        {"poll_id": 1000 + i, "name": f"allergen {i}", "latin": f"Allergenum {i}"}
+        for i in range(len(titles), args.allergens)
+    ]
+    titles = titles[: args.allergens]
+    rng = random.Random(1)
+    payloads = [make_payload(titles, rng) for _ in range(args.locations)]
+    names = [t["name"] for t in titles]
+    slugs = [slugify(t["name"]) for t in titles]
+    blocks = (block_en, block_en)
+    forecasts = parse_all(payloads, blocks)
+
+    print(
+        f"{len(titles)} allergens x {args.locations} locations, "
+        f"{2 * len(titles) * args.locations} lookups per burst"
+    )
+    results = {}
+    for label, func in (
+        ("scan raw contamination", lambda: burst_scan(payloads, names)),
+        ("scan parsed records", lambda: burst_records(forecasts, slugs)),
+        ("index lookup", lambda: burst_index(forecasts, slugs)),
+        ("parse payloads (once)", lambda: parse_all(payloads, blocks)),
+    ):
+        seconds = min(timeit.repeat(func, number=args.number, repeat=5))
+        results[label] = seconds / args.number * 1000
+        print(f"  {label:<24} {results[label]:9.3f} ms/burst")
+    speedup = results["scan raw contamination"] / results["index lookup"]
+    print(f"  index vs raw scan: {speedup:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
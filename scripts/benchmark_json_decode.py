@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Micro-benchmark JSON decoding of forecast payloads.
+
+Compares the stdlib decoder (what aiohttp's resp.json() uses) with orjson,
+which api.py uses when it is installed. Runs against the payloads in
+scripts/fixtures/ by default; pass other recorded responses as arguments.
+
+    python scripts/benchmark_json_decode.py [payload.json ...]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def bench(label: str, func, raw: bytes, number: int) -> float:
+    seconds = min(timeit.repeat(lambda: func(raw), number=number, repeat=5))
+    per_call_us = seconds / number * 1e6
+    print(f"  {label:<28} {per_call_us:9.2f} µs/decode")
+    return per_call_us
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payloads", nargs="*", type=Path)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    paths = args.payloads or sorted(FIXTURES.glob("*.json"))
+    if not paths:
+        print("No payloads found.", file=sys.stderr)
+        return 1
+    if orjson is None:
+        print("orjson is not installed; only the stdlib decoder is measured.")
+
+    for path in paths:
+        raw = path.read_bytes()
+        print(f"{path.name} ({len(raw)} bytes)")
+        # resp.json() decodes the body to str before json.loads
+        stdlib_text = bench(
+            "stdlib (bytes -> str)",
+            lambda b: json.loads(b.decode("utf-8")),
+            raw,
+            args.number,
+        )
+        bench("stdlib (bytes)", json.loads, raw, args.number)
+        if orjson is not None:
+            fast = bench("orjson (bytes)", orjson.loads, raw, args.number)
+            print(f"  speedup vs resp.json() path: {stdlib_text / fast:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
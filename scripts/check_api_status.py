@@ -2,7 +2,8 @@
 """Check polleninformation.at API status for all supported countries.
 
 Outputs status as JSON and HTML for GitHub Pages.
-Requires POLLENAT_API_KEY environment variable.
+Requires POLLENAT_API_KEY environment variable. Set POLLENAT_API_BASE to
+check against another server, e.g. scripts/standin_server.py.
 """
 
 import asyncio
@@ -16,8 +17,11 @@ from pathlib import Path
 import aiohttp
 import async_timeout
 
+API_BASE = os.environ.get(
+    "POLLENAT_API_BASE", "https://www.polleninformation.at"
+).rstrip("/")
 API_URL = (
-    "https://www.polleninformation.at/api/forecast/public"
+    API_BASE + "/api/forecast/public"
     "?country={country}"
     "&lang=en"
     "&latitude={lat}"
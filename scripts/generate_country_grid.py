@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Generate the bundled country lookup grid (country_grid.json).
+
+The integration resolves latitude/longitude to a country code offline with a
+regular grid over Europe and Turkey. Each cell holds the country of the
+nearest populated place in GeoNames' cities1000 dump, or nothing when no
+place is within MAX_DISTANCE_KM (open sea). Rows are run-length encoded as
+"<count><CC>" runs, "--" marking empty cells, e.g. "12--40AT33DE".
+
+Input is either GeoNames' cities1000.txt (tab separated, CC BY 4.0,
+https://download.geonames.org/export/dump/cities1000.zip) or a CSV with lat,
+lon and cc columns such as rg_cities1000.csv from the reverse_geocoder
+package.
+
+    python scripts/generate_country_grid.py cities1000.txt \\
+        > custom_components/polleninformation/country_grid.json
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+
+# Grid bounds and resolution; covers SUPPORTED_COUNTRIES and their neighbours
+LAT_MIN, LAT_MAX = 34.0, 72.0
+LON_MIN, LON_MAX = -11.0, 45.0
+STEP = 0.1  # degrees, about 11 km north-south
+MAX_DISTANCE_KM = 60.0
+MARGIN = 1.0  # degrees of places loaded outside the grid bounds
+BUCKET = 0.2  # degrees per spatial bucket for the nearest-place search
+
+
+def load_places(path):
+    """Return (lat, lon, cc) tuples from a GeoNames dump or a lat/lon/cc CSV."""
+    places = []
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+        f.seek(0)
+        if "\t" in first:
+            rows = ((r[4], r[5], r[8]) for r in csv.reader(f, delimiter="\t"))
+        else:
+            rows = ((r["lat"], r["lon"], r["cc"]) for r in csv.DictReader(f))
+        for lat, lon, cc in rows:
+            lat, lon = float(lat), float(lon)
+            if (
+                LAT_MIN - MARGIN <= lat <= LAT_MAX + MARGIN
+                and LON_MIN - MARGIN <= lon <= LON_MAX + MARGIN
+                and len(cc) == 2
+            ):
+                places.append((lat, lon, cc.upper()))
+    return places
+
+
+def bucket_places(places):
+    buckets = {}
+    for lat, lon, cc in places:
+        key = (math.floor(lat / BUCKET), math.floor(lon / BUCKET))
+        buckets.setdefault(key, []).append((lat, lon, cc))
+    return buckets
+
+
+def nearest_country(buckets, lat, lon):
+    """Return the country of the nearest place within MAX_DISTANCE_KM, or None."""
+    cos_lat = math.cos(math.radians(lat))
+    reach = math.ceil(MAX_DISTANCE_KM / 111.0 / cos_lat / BUCKET) + 1
+    b_lat, b_lon = math.floor(lat / BUCKET), math.floor(lon / BUCKET)
+    best, best_distance = None, MAX_DISTANCE_KM
+    # Search rings of buckets outwards; places beyond ring r are at least
+    # r buckets away, so stop once the best match is closer than that.
+    for ring in range(reach + 1):
+        for d_lat in range(-ring, ring + 1):
+            for d_lon in range(-ring, ring + 1):
+                if max(abs(d_lat), abs(d_lon)) != ring:
+                    continue
+                key = (b_lat + d_lat, b_lon + d_lon)
+                for p_lat, p_lon, cc in buckets.get(key, ()):
+                    distance = 111.0 * math.hypot(p_lat - lat, (p_lon - lon) * cos_lat)
+                    if distance < best_distance:
+                        best, best_distance = cc, distance
+        if best_distance <= ring * BUCKET * 111.0 * cos_lat:
+            break
+    return best
+
+
+def encode_row(cells):
+    runs = []
+    previous, count = None, 0
+    for cc in cells:
+        if cc == previous:
+            count += 1
+            continue
+        if count:
+            runs.append(f"{count}{previous or '--'}")
+        previous, count = cc, 1
+    runs.append(f"{count}{previous or '--'}")
+    return "".join(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("places", help="cities1000.txt or a lat,lon,cc CSV")
+    args = parser.parse_args()
+
+    buckets = bucket_places(load_places(args.places))
+    n_rows = round((LAT_MAX - LAT_MIN) / STEP)
+    n_cols = round((LON_MAX - LON_MIN) / STEP)
+    rows = []
+    for row in range(n_rows):
+        lat = LAT_MIN + (row + 0.5) * STEP
+        cells = [
+            nearest_country(buckets, lat, LON_MIN + (col + 0.5) * STEP)
+            for col in range(n_cols)
+        ]
+        rows.append(encode_row(cells))
+        print(f"row {row + 1}/{n_rows}", file=sys.stderr, end="\r")
+    print(file=sys.stderr)
+
+    grid = {
+        "source": "GeoNames cities1000, CC BY 4.0, https://www.geonames.org/",
+        "lat_min": LAT_MIN,
+        "lon_min": LON_MIN,
+        "step": STEP,
+        "cols": n_cols,
+        "rows": rows,
+    }
+    json.dump(grid, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Local stand-in for the polleninformation.at forecast API.
+
+Serves recorded /api/forecast/public payloads by country and coordinate, with
+configurable latency and fault injection, so api.py, the coordinator and the
+scripts can be exercised offline and deterministically.
+
+Payloads are looked up in the fixtures directory (scripts/fixtures/ by
+default). A file named forecast_<CC>_<lat>_<lon>.json serves requests for
+that country near that coordinate; forecast_<CC>.json serves every other
+coordinate in the country. Unknown countries get an empty contamination list,
+like the real API.
+
+Replay recorded payloads with faults:
+
+    python scripts/standin_server.py --latency 200 --jitter 100 \\
+        --fault 429:0.1 --fault 503:0.05 --malformed-rate 0.02 --seed 1
+
+Record live responses into the fixtures directory (requires a real key):
+
+    python scripts/standin_server.py --record
+
+Point check_api_status.py at it with:
+
+    export POLLENAT_API_BASE=http://127.0.0.1:8765
+
+The integration always calls the real API; tests/test_api.py runs api.py
+against build_app() by patching api.API_URL.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+UPSTREAM_BASE = "https://www.polleninformation.at"
+FORECAST_PATH = "/api/forecast/public"
+FIXTURES = Path(__file__).parent / "fixtures"
+COORDINATE_TOLERANCE = 0.05  # degrees for coordinate-specific fixtures
+
+FAULT_BODIES = {
+    401: {"error": "Invalid API key"},
+    403: {"error": "API key not authorized for this resource"},
+}
+
+
+class FixtureStore:
+    """Recorded payloads indexed by country and coordinate."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.by_country: dict[str, dict] = {}
+        self.by_point: dict[str, list[tuple[float, float, dict]]] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        self.by_country.clear()
+        self.by_point.clear()
+        for path in sorted(self.directory.glob("forecast_*.json")):
+            parts = path.stem.split("_")[1:]
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            country = parts[0].upper()
+            if len(parts) == 3:
+                point = (float(parts[1]), float(parts[2]), payload)
+                self.by_point.setdefault(country, []).append(point)
+            else:
+                self.by_country[country] = payload
+
+    def lookup(self, country: str, lat: float, lon: float) -> dict:
+        best = None
+        best_distance = COORDINATE_TOLERANCE
+        for p_lat, p_lon, payload in self.by_point.get(country, []):
+            distance = max(abs(p_lat - lat), abs(p_lon - lon))
+            if distance <= best_distance:
+                best, best_distance = payload, distance
+        if best is not None:
+            return best
+        return self.by_country.get(
+            country, {"contamination": [], "allergyrisk": {}, "allergyrisk_hourly": {}}
+        )
+
+    def save(self, country: str, lat: float, lon: float, payload: dict) -> Path:
+        path = self.directory / f"forecast_{country}_{lat:.4f}_{lon:.4f}.json"
+        path.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        self.by_point.setdefault(country, []).append((lat, lon, payload))
+        return path
+
+
+def parse_fault(value: str) -> tuple[int, float]:
+    status, _, rate = value.partition(":")
+    return int(status), float(rate or 1.0)
+
+
+def build_app(args: argparse.Namespace) -> web.Application:
+    rng = random.Random(args.seed)
+    store = FixtureStore(args.fixtures)
+    stats = {"requests": 0, "faults": 0}
+
+    async def forecast(request: web.Request) -> web.StreamResponse:
+        stats["requests"] += 1
+        query = request.query
+        try:
+            country = query["country"].upper()
+            lat = float(query["latitude"])
+            lon = float(query["longitude"])
+        except (KeyError, ValueError):
+            return web.json_response({"error": "Missing or invalid parameters"})
+
+        delay = args.latency + rng.uniform(-args.jitter, args.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if args.apikey and query.get("apikey") != args.apikey:
+            stats["faults"] += 1
+            return web.json_response(FAULT_BODIES[401], status=401)
+
+        for status, rate in args.fault:
+            if rng.random() < rate:
+                stats["faults"] += 1
+                headers = {}
+                if status in (429, 503) and args.retry_after is not None:
+                    headers["Retry-After"] = str(args.retry_after)
+                body = FAULT_BODIES.get(status, {"error": f"HTTP {status}"})
+                return web.json_response(body, status=status, headers=headers)
+
+        if rng.random() < args.malformed_rate:
+            stats["faults"] += 1
+            return web.Response(
+                body=b'{"contamination": [{"poll_title": ',
+                content_type="application/json",
+            )
+
+        if args.record:
+            url = f"{UPSTREAM_BASE}{FORECAST_PATH}?{request.query_string}"
+            async with request.app["session"].get(url) as resp:
+                payload = await resp.json(content_type=None)
+                if resp.status == 200 and "contamination" in payload:
+                    path = store.save(country, lat, lon, payload)
+                    print(f"Recorded {path.name}")
+                return web.json_response(payload, status=resp.status)
+
+        return web.json_response(store.lookup(country, lat, lon))
+
+    async def status(request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                **stats,
+                "countries": sorted(store.by_country),
+                "points": {c: len(p) for c, p in store.by_point.items()},
+            }
+        )
+
+    async def on_startup(app: web.Application) -> None:
+        app["session"] = aiohttp.ClientSession()
+
+    async def on_cleanup(app: web.Application) -> None:
+        await app["session"].close()
+
+    app = web.Application()
+    app.router.add_get(FORECAST_PATH, forecast)
+    app.router.add_get("/_standin/status", status)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES)
+    parser.add_argument("--latency", type=float, default=0, help="ms per request")
+    parser.add_argument("--jitter", type=float, default=0, help="± ms of latency")
+    parser.add_argument(
+        "--fault",
+        type=parse_fault,
+        action="append",
+        default=[],
+        metavar="STATUS:RATE",
+        help="answer with STATUS for a RATE share of requests, e.g. 429:0.1",
+    )
+    parser.add_argument(
+        "--retry-after", type=int, help="Retry-After seconds on 429/503"
+    )
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0, help="share of truncated bodies"
+    )
+    parser.add_argument("--apikey", help="reject other keys with 401")
+    parser.add_argument("--seed", type=int, help="seed for deterministic faults")
+    parser.add_argument(
+        "--record", action="store_true", help="proxy to the live API and save"
+    )
+    args = parser.parse_args()
+
+    if not args.fixtures.is_dir():
+        print(f"Fixtures directory not found: {args.fixtures}", file=sys.stderr)
+        return 1
+    web.run_app(build_app(args), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Fixtures for polleninformation tests."""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.polleninformation import api, circuit, metrics, ratelimit
+from custom_components.polleninformation.const import (
+    CONF_STARTUP_MODE,
+    DOMAIN,
+    STARTUP_MODE_BLOCKING,
+)
+
+FIXTURES = Path(__file__).parent.parent / "scripts" / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading custom integrations in all tests."""
+    return
+
+
+@pytest.fixture(autouse=True)
+def reset_registries():
+    """Start every test without process-wide API state from earlier tests."""
+    yield
+    api._INFLIGHT.clear()
+    circuit._BREAKERS.clear()
+    metrics._METRICS.clear()
+    ratelimit._LIMITERS.clear()
+
+
+@pytest.fixture
+def payload() -> dict:
+    """Return a recorded forecast payload for Sweden."""
+    return json.loads((FIXTURES / "forecast_SE.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def mock_api(payload):
+    """Answer API requests with the recorded payload, without network access."""
+    with patch(
+        "custom_components.polleninformation.cache.async_get_pollenat_data",
+        new=AsyncMock(side_effect=lambda *args, **kwargs: copy.deepcopy(payload)),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    """Return a config entry for Stockholm."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Stockholm",
+        data={
+            "country": "SE",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+            "lang": "en",
+            "apikey": "test-key",
+            "location": "Stockholm",
+            "location_title": "Stockholm",
+            "location_slug": "stockholm",
+        },
+        options={CONF_STARTUP_MODE: STARTUP_MODE_BLOCKING},
+    )
@@ -0,0 +1,126 @@
+"""Tests for the polleninformation.at API client."""
+
+from __future__ import annotations
+
+import importlib.util
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+
+from custom_components.polleninformation import api
+from custom_components.polleninformation.circuit import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    STATE_CLOSED,
+    STATE_OPEN,
+    get_circuit_breaker,
+)
+
+SCRIPTS = Path(__file__).parent.parent / "scripts"
+
+
+def _load_standin_server():
+    spec = importlib.util.spec_from_file_location(
+        "standin_server", SCRIPTS / "standin_server.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+standin_server = _load_standin_server()
+
+
+@pytest.fixture
+async def standin(socket_enabled, monkeypatch):
+    """Start the stand-in API server with the given options and point api.py at it."""
+    servers: list[TestServer] = []
+
+    async def _async_start(**options) -> None:
+        args = Namespace(
+            fixtures=SCRIPTS / "fixtures",
+            latency=0,
+            jitter=0,
+            fault=[],
+            retry_after=None,
+            malformed_rate=0,
+            apikey=None,
+            seed=1,
+            record=False,
+        )
+        for key, value in options.items():
+            setattr(args, key, value)
+        server = TestServer(standin_server.build_app(args))
+        await server.start_server()
+        servers.append(server)
+        base = str(server.make_url("")).rstrip("/")
+        monkeypatch.setattr(
+            api,
+            "API_URL",
+            api.API_URL.replace("https://www.polleninformation.at", base),
+        )
+
+    yield _async_start
+    for server in servers:
+        await server.close()
+
+
+async def _async_fetch_failing(hass: HomeAssistant, error: Exception) -> None:
+    with (
+        patch.object(api, "_async_fetch_pollenat_data", AsyncMock(side_effect=error)),
+        patch.object(api, "_backoff_delay", return_value=0),
+        pytest.raises(type(error)),
+    ):
+        await api.async_get_pollenat_data(hass, 59.33, 18.07, "SE", "en", "key")
+
+
+async def test_rate_limit_does_not_open_circuit(hass: HomeAssistant) -> None:
+    """A 429 for one API key leaves the country's circuit closed."""
+    error = api.PollenApiRateLimitError("API returned HTTP 429", status=429)
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD + 1):
+        await _async_fetch_failing(hass, error)
+
+    breaker = get_circuit_breaker("SE")
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+
+
+async def test_unavailable_opens_circuit(hass: HomeAssistant) -> None:
+    """Repeated 503 responses open the country's circuit."""
+    error = api.PollenApiRateLimitError("API returned HTTP 503", status=503)
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        await _async_fetch_failing(hass, error)
+
+    assert get_circuit_breaker("SE").state == STATE_OPEN
+
+
+async def test_fetch_from_standin(hass: HomeAssistant, standin, payload) -> None:
+    """A recorded payload is fetched and decoded."""
+    await standin()
+
+    data = await api.async_get_pollenat_data(hass, 59.33, 18.07, "SE", "en", "key")
+
+    assert data == payload
+
+
+async def test_standin_rate_limit(hass: HomeAssistant, standin) -> None:
+    """A 429 carries its Retry-After and leaves the circuit closed."""
+    await standin(fault=[(429, 1.0)], retry_after=3600)
+
+    with pytest.raises(api.PollenApiRateLimitError) as err:
+        await api.async_get_pollenat_data(hass, 59.33, 18.07, "SE", "en", "key")
+
+    assert err.value.status == 429
+    assert err.value.retry_after == 3600
+    assert get_circuit_breaker("SE").state == STATE_CLOSED
+
+
+async def test_standin_malformed_body(hass: HomeAssistant, standin) -> None:
+    """A truncated body is reported as an API error, not retried."""
+    await standin(malformed_rate=1.0)
+
+    with pytest.raises(api.PollenApiError, match="Malformed JSON"):
+        await api.async_get_pollenat_data(hass, 59.33, 18.07, "SE", "en", "key")
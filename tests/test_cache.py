@@ -0,0 +1,114 @@
+"""Tests for the polleninformation response cache."""
+
+from __future__ import annotations
+
+import copy
+import time
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.polleninformation.cache import (
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    PollenResponseCache,
+)
+
+
+async def test_payloads_outlive_off_season_interval(
+    hass: HomeAssistant, payload, freezer
+) -> None:
+    """A payload is kept until after the next daily off-season refresh."""
+    cache = PollenResponseCache(hass)
+    await cache.async_load()
+    cache.set("SE:59.33:18.07:abc", payload)
+
+    freezer.tick(timedelta(hours=36))
+    cache.set("SE:55.6:13.0:abc", payload)
+
+    assert cache.peek("SE:59.33:18.07:abc") is not None
+
+
+async def test_restore_keeps_day_old_payloads(
+    hass: HomeAssistant, hass_storage, payload
+) -> None:
+    """A payload stored a day before a restart is loaded again."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "SE:59.33:18.07:abc": {
+                "data": payload,
+                "fetched_at": time.time() - 24 * 3600,
+            }
+        },
+    }
+    cache = PollenResponseCache(hass)
+    await cache.async_load()
+
+    assert cache.peek("SE:59.33:18.07:abc") is not None
+
+
+async def test_publication_schedule_persisted(
+    hass: HomeAssistant, hass_storage, payload
+) -> None:
+    """The publication schedule of a cell is saved and loaded with its payload."""
+    cache = PollenResponseCache(hass)
+    await cache.async_load()
+    cache.set("SE:59.33:18.07:abc", payload)
+    cache.set_publication("SE:59.33:18.07:abc", {"samples": [[360.0, 1.0]]})
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": cache._data_to_save(),
+    }
+
+    restored = PollenResponseCache(hass)
+    assert await restored.async_peek_publication("SE:59.33:18.07:abc") == {
+        "samples": [[360.0, 1.0]]
+    }
+
+
+async def test_localize_memoized_per_payload(hass: HomeAssistant, payload) -> None:
+    """Localized payloads are reused until the canonical payload changes."""
+    cache = PollenResponseCache(hass)
+    await cache.async_load()
+    key = "SE:59.33:18.07:abc"
+    cached = cache.set(key, payload)
+
+    localized = await cache.async_localize(key, cached, "sv")
+    titles = [item["poll_title"] for item in localized.data["contamination"]]
+    assert "Björk (Betula)" in titles
+    assert localized.content_hash == cached.content_hash
+    assert await cache.async_localize(key, cached, "sv") is localized
+
+    changed = copy.deepcopy(payload)
+    changed["contamination"][0]["contamination_1"] = 4
+    updated = cache.set(key, changed)
+    relocalized = await cache.async_localize(key, updated, "sv")
+
+    assert relocalized is not localized
+    assert relocalized.data["contamination"][0]["contamination_1"] == 4
+    assert relocalized.content_hash == updated.content_hash
+
+
+async def test_localize_warns_about_missing_names(
+    hass: HomeAssistant, payload, caplog
+) -> None:
+    """Allergens without names in the language are reported once."""
+    cache = PollenResponseCache(hass)
+    await cache.async_load()
+    key = "SE:59.33:18.07:abc"
+    payload["contamination"].append(
+        {"poll_id": 8, "poll_title": "oak (Quercus)", "contamination_1": 1}
+    )
+    cached = cache.set(key, payload)
+
+    localized = await cache.async_localize(key, cached, "sv")
+    cache._localized.clear()
+    await cache.async_localize(key, cached, "sv")
+
+    assert localized.data["contamination"][-1]["poll_title"] == "oak (Quercus)"
+    warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert "oak (Quercus)" in warnings[0].getMessage()
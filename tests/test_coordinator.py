@@ -0,0 +1,143 @@
+"""Tests for the polleninformation data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.polleninformation.api import PollenApiRateLimitError
+from custom_components.polleninformation.const import DEFAULT_CACHE_TTL, DOMAIN
+from custom_components.polleninformation.polling import (
+    MAX_CONCURRENT_FETCHES,
+    get_refresh_scheduler,
+)
+
+
+async def _async_setup(hass: HomeAssistant, config_entry):
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    # Send every refresh to the API instead of the response cache.
+    coordinator.cache_ttl = 0
+    return coordinator
+
+
+async def test_rate_limit_honours_retry_after(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """A long Retry-After postpones the next refresh past the recovery interval."""
+    coordinator = await _async_setup(hass, config_entry)
+
+    mock_api.side_effect = PollenApiRateLimitError("HTTP 429", retry_after=3600)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval >= timedelta(hours=1)
+
+    mock_api.side_effect = PollenApiRateLimitError("HTTP 429")
+    await coordinator.async_refresh()
+    assert coordinator.update_interval < timedelta(hours=1)
+
+
+async def test_unchanged_payload_keeps_issue_date(
+    hass: HomeAssistant, config_entry, mock_api, freezer
+) -> None:
+    """Refetching the same payload after midnight keeps shifting the days."""
+    freezer.move_to(
+        dt_util.parse_datetime("2026-05-01 20:00:00").replace(
+            tzinfo=dt_util.get_default_time_zone()
+        )
+    )
+    coordinator = await _async_setup(hass, config_entry)
+    assert coordinator.data.day_offset() == 0
+
+    freezer.tick(timedelta(hours=8))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data.issued == date(2026, 5, 1)
+    assert coordinator.data.day_offset() == 1
+
+
+async def test_cache_hit_needs_no_fetch_slot(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """A refresh served from the response cache does not wait for a fetch slot."""
+    coordinator = await _async_setup(hass, config_entry)
+    coordinator.cache_ttl = DEFAULT_CACHE_TTL
+    slots = get_refresh_scheduler(hass).fetch_slots
+    for _ in range(MAX_CONCURRENT_FETCHES):
+        await slots.acquire()
+    try:
+        async with asyncio.timeout(1):
+            await coordinator.async_refresh()
+    finally:
+        for _ in range(MAX_CONCURRENT_FETCHES):
+            slots.release()
+    assert coordinator.last_update_success
+    assert mock_api.call_count == 1
+
+
+async def test_languages_of_one_cell_fetch_once(
+    hass: HomeAssistant, config_entry, mock_api, freezer
+) -> None:
+    """Coordinators of one grid cell in two languages refresh together."""
+    config_entry.add_to_hass(hass)
+    entry_sv = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stockholm (sv)",
+        data={**config_entry.data, "lang": "sv", "location_title": "Stockholm sv"},
+        options=config_entry.options,
+    )
+    entry_sv.add_to_hass(hass)
+    # Setting up the integration sets up both entries.
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator_en = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator_sv = hass.data[DOMAIN][entry_sv.entry_id]
+    assert coordinator_en is not coordinator_sv
+    assert mock_api.call_count == 1
+
+    for refresh in range(2, 5):
+        assert coordinator_en.update_interval == coordinator_sv.update_interval
+        freezer.tick(coordinator_en.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert mock_api.call_count == refresh
+
+
+async def test_fresh_fetch_is_not_stale(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """A payload fetched for the refresh is not stale, even with a TTL of 0."""
+    coordinator = await _async_setup(hass, config_entry)
+
+    await coordinator.async_refresh()
+
+    assert mock_api.call_count == 2
+    assert not coordinator.serving_stale
+    assert coordinator.consecutive_failures == 0
+
+
+async def test_publication_schedule_survives_reload(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """The learned publication schedule is kept across a reload."""
+    coordinator = await _async_setup(hass, config_entry)
+    coordinator.publication.restore({"samples": [[360, 1], [365, 1], [370, 1]]})
+    await coordinator.async_refresh()
+    expected = coordinator.publication.expected_minute
+    assert expected is not None
+
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    reloaded = hass.data[DOMAIN][config_entry.entry_id]
+    assert reloaded is not coordinator
+    assert reloaded.publication.expected_minute == expected
@@ -0,0 +1,29 @@
+"""Tests for polleninformation diagnostics."""
+
+from __future__ import annotations
+
+import json
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+from custom_components.polleninformation.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_diagnostics_hide_location(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """Neither the coordinates nor the grid cell key leak into diagnostics."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["coordinator"]["cell_key"] == REDACTED
+    dumped = json.dumps(diagnostics, default=str)
+    assert "59.33" not in dumped
+    assert "18.07" not in dumped
+    assert "test-key" not in dumped
@@ -0,0 +1,132 @@
+"""Tests for setting up and unloading polleninformation entries."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from custom_components.polleninformation.const import (
+    CONF_STARTUP_MODE,
+    DATA_COORDINATORS,
+    DOMAIN,
+    STARTUP_MODE_BACKGROUND,
+)
+
+RELOAD_CYCLES = 1000
+
+
+async def test_setup_and_unload(hass: HomeAssistant, config_entry, mock_api) -> None:
+    """An entry sets up its sensors and releases its coordinator on unload."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("sensor.polleninformation_stockholm_birch") is not None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.entry_id not in hass.data[DOMAIN]
+
+
+async def test_background_startup_from_registry(
+    hass: HomeAssistant, config_entry, mock_api, payload, caplog
+) -> None:
+    """Entities restored before the first refresh are not reported as stale."""
+    config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_STARTUP_MODE: STARTUP_MODE_BACKGROUND}
+    )
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "polleninformation_stockholm_birch",
+        config_entry=config_entry,
+        suggested_object_id="polleninformation_stockholm_birch",
+    )
+    release = asyncio.Event()
+
+    async def _async_slow_fetch(*args, **kwargs):
+        await release.wait()
+        return copy.deepcopy(payload)
+
+    mock_api.side_effect = _async_slow_fetch
+
+    with caplog.at_level(logging.DEBUG):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=False)
+
+    state = hass.states.get("sensor.polleninformation_stockholm_birch")
+    assert state is not None
+    assert "stale_since" not in state.attributes
+    assert "data_stale" not in state.attributes
+    assert "recreating" not in caplog.text
+    assert "restoring 1 entities from the registry" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+def _bus_listeners(hass: HomeAssistant) -> dict[str, int]:
+    """Return the bus listener counts, except those of delayed writes."""
+    listeners = hass.bus.async_listeners()
+    listeners.pop(EVENT_HOMEASSISTANT_FINAL_WRITE, None)
+    return listeners
+
+
+def _active_timers(hass: HomeAssistant) -> int:
+    """Return the number of timers on the event loop, except delayed writes."""
+    return sum(
+        1
+        for handle in hass.loop._scheduled
+        if not handle.cancelled()
+        and not isinstance(getattr(handle._callback, "__self__", None), Store)
+    )
+
+
+async def test_reload_does_not_leak(
+    hass: HomeAssistant, config_entry, mock_api
+) -> None:
+    """Repeated reloads leave one coordinator and no stray listeners or timers."""
+    config_entry.add_to_hass(hass)
+    # A first load and unload sets up the sensor platform itself, which keeps
+    # its own listeners.
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    timers = _active_timers(hass)
+    bus_listeners = _bus_listeners(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    loaded_timers = _active_timers(hass)
+    loaded_bus_listeners = _bus_listeners(hass)
+
+    for _ in range(RELOAD_CYCLES):
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert len(config_entry.update_listeners) == 1
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    assert len(coordinators) == 1
+    (coordinator,) = coordinators.values()
+    assert coordinator.users == {config_entry.entry_id}
+    assert _active_timers(hass) == loaded_timers
+    assert _bus_listeners(hass) == loaded_bus_listeners
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.entry_id not in hass.data[DOMAIN]
+    assert hass.data[DOMAIN][DATA_COORDINATORS] == {}
+    assert _bus_listeners(hass) == bus_listeners
+    assert _active_timers(hass) == timers
@@ -0,0 +1,150 @@
+"""Tests for the refresh scheduling logic."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+from custom_components.polleninformation.polling import (
+    LATE_RETRY,
+    MAX_INTERVAL,
+    OFF_SEASON_REFRESHES,
+    PUBLICATION_MARGIN,
+    PublicationSchedule,
+    RefreshScheduler,
+    SeasonTracker,
+)
+
+FALLBACK = timedelta(hours=8)
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 5, day, hour, minute, tzinfo=UTC)
+
+
+def _learned_schedule() -> PublicationSchedule:
+    """Return a schedule that saw a publication between 05:00 and 07:00 on 3 days."""
+    schedule = PublicationSchedule()
+    for day in (1, 2, 3):
+        schedule.record(_at(day, 5), False)
+        schedule.record(_at(day, 7), True)
+    return schedule
+
+
+def test_publication_unknown_uses_fallback() -> None:
+    """Until enough changes are seen, the fallback interval is used."""
+    schedule = PublicationSchedule()
+    schedule.record(_at(1, 5), False)
+    schedule.record(_at(1, 7), True)
+
+    assert schedule.expected_minute is None
+    assert schedule.next_interval(_at(1, 8), FALLBACK) == FALLBACK
+
+
+def test_publication_learned_from_changes() -> None:
+    """The expected publication is the middle of the windows with changes."""
+    assert _learned_schedule().expected_minute == 6 * 60
+
+
+def test_publication_next_refresh_after_expected_time() -> None:
+    """The next refresh follows the next expected publication."""
+    schedule = _learned_schedule()
+
+    delay = schedule.next_interval(_at(4, 3), FALLBACK)
+
+    assert delay == _at(4, 6) + PUBLICATION_MARGIN - _at(4, 3)
+
+
+def test_publication_overdue_retries() -> None:
+    """While a publication is overdue, refreshes come every LATE_RETRY."""
+    schedule = _learned_schedule()
+
+    assert schedule.next_interval(_at(4, 6, 5), FALLBACK) == timedelta(minutes=10)
+    assert schedule.next_interval(_at(4, 7), FALLBACK) == LATE_RETRY
+
+
+def test_publication_seen_waits_at_most_max_interval() -> None:
+    """After today's publication was seen, the wait is capped."""
+    schedule = _learned_schedule()
+    schedule.record(_at(4, 6, 20), True)
+
+    assert schedule.next_interval(_at(4, 6, 20), FALLBACK) == MAX_INTERVAL
+
+
+def test_publication_storage_round_trip() -> None:
+    """A restored schedule has the same estimate and last change."""
+    schedule = _learned_schedule()
+    restored = PublicationSchedule()
+
+    restored.restore(schedule.to_storage())
+
+    assert restored.expected_minute == schedule.expected_minute
+    assert restored.last_change == schedule.last_change
+    assert restored.last_fetch == schedule.last_fetch
+
+
+def test_publication_restore_skips_malformed() -> None:
+    """Malformed stored samples and times are ignored."""
+    schedule = PublicationSchedule()
+
+    schedule.restore({"samples": [[360, 1], "x", [1]], "last_fetch": "never"})
+
+    assert schedule.to_storage() == {
+        "samples": [[360.0, 1.0]],
+        "last_fetch": None,
+        "last_change": None,
+    }
+
+
+def test_season_off_after_quiet_refreshes() -> None:
+    """Outside the calendar season, quiet refreshes switch to off season."""
+    tracker = SeasonTracker("SE")
+    winter = date(2026, 12, 1)
+    for _ in range(OFF_SEASON_REFRESHES - 1):
+        tracker.record(True)
+    assert not tracker.is_off_season(winter)
+
+    tracker.record(True)
+    assert tracker.is_off_season(winter)
+
+    tracker.record(False)
+    assert not tracker.is_off_season(winter)
+
+
+def test_season_calendar_keeps_normal_schedule() -> None:
+    """Within the calendar season, quiet refreshes do not switch off season."""
+    tracker = SeasonTracker("SE")
+    for _ in range(OFF_SEASON_REFRESHES):
+        tracker.record(True)
+
+    assert not tracker.is_off_season(date(2026, 3, 1))
+    assert tracker.is_off_season(date(2026, 10, 1))
+
+
+def test_align_lands_on_phase() -> None:
+    """Aligned refreshes end on the key's phase within the interval."""
+    scheduler = RefreshScheduler()
+    for key in ("a", "b", "c"):
+        scheduler.register(key)
+    interval = timedelta(hours=8)
+    period = interval.total_seconds()
+
+    for now in (_at(1, 0), _at(1, 3, 17), _at(2, 23, 59)):
+        delay = scheduler.align("b", interval, now)
+        assert interval / 2 <= delay <= interval * 3 / 2
+        end = (now + delay).timestamp()
+        assert abs(end % period - scheduler.phase("b") * period) < 1e-3
+
+
+def test_phase_shared_until_last_user_leaves() -> None:
+    """A key keeps its rank while any coordinator still uses it."""
+    scheduler = RefreshScheduler()
+    scheduler.register("a")
+    scheduler.register("b")
+    scheduler.register("b")
+    phase = scheduler.phase("b")
+
+    scheduler.unregister("b")
+    assert scheduler.phase("b") == phase
+
+    scheduler.unregister("b")
+    assert scheduler.phase("b") != phase
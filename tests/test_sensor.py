@@ -0,0 +1,52 @@
+"""Tests for the polleninformation sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+HOURLY_SENSOR = "sensor.polleninformation_stockholm_allergy_risk_hourly"
+
+
+async def _async_setup(hass: HomeAssistant, config_entry) -> None:
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_forecast_follows_home_assistant_time_zone(
+    hass: HomeAssistant, config_entry, mock_api, freezer
+) -> None:
+    """Forecast days start at midnight in the configured time zone."""
+    await hass.config.async_set_time_zone("Pacific/Kiritimati")
+    freezer.move_to("2026-05-01 12:00:00+00:00")
+    await _async_setup(hass, config_entry)
+
+    state = hass.states.get("sensor.polleninformation_stockholm_birch")
+    assert state.attributes["forecast"][0]["time"] == "2026-05-02T00:00:00"
+
+    hourly = hass.states.get(HOURLY_SENSOR).attributes["forecast"]
+    assert hourly[0]["time"] == "2026-05-02T00:00:00+14:00"
+    assert hourly[25]["time"] == "2026-05-03T01:00:00+14:00"
+
+
+async def test_hourly_forecast_shifts_at_midnight(
+    hass: HomeAssistant, config_entry, mock_api, payload, freezer
+) -> None:
+    """After midnight, the hourly forecast starts with the next day's values."""
+    await hass.config.async_set_time_zone("Europe/Stockholm")
+    freezer.move_to("2026-05-01 20:00:00+02:00")
+    await _async_setup(hass, config_entry)
+
+    freezer.tick(timedelta(hours=4, minutes=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    hourly = hass.states.get(HOURLY_SENSOR).attributes["forecast"]
+    assert hourly[0]["time"] == "2026-05-02T00:00:00+02:00"
+    assert (
+        hourly[0]["level_raw"]
+        == payload["allergyrisk_hourly"]["allergyrisk_hourly_2"][0]
+    )
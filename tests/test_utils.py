@@ -0,0 +1,56 @@
+"""Tests for the polleninformation helpers."""
+
+from __future__ import annotations
+
+from custom_components.polleninformation.utils import localize_payload
+
+BLOCK = {
+    "lang_code": "es",
+    "poll_titles": [
+        {"name": "Artemisia", "latin": "", "poll_id": 7},
+        {"name": "Abedul", "latin": "Betula", "poll_id": 2},
+        {"name": "", "latin": "Alnus", "poll_id": 1},
+    ],
+}
+
+
+def test_localize_payload() -> None:
+    """Titles are rebuilt from the block, keeping the original Latin name."""
+    data = {
+        "contamination": [
+            {"poll_id": 7, "poll_title": "mugwort (Artemisia)", "contamination_1": 1},
+            {"poll_id": 2, "poll_title": "birch (Betula)", "contamination_1": 2},
+            {"poll_id": 1, "poll_title": "alder (Alnus)", "contamination_1": 3},
+            {"poll_id": 8, "poll_title": "oak (Quercus)", "contamination_1": 4},
+            {"poll_id": 9, "poll_title": "lime", "contamination_1": 0},
+        ],
+        "allergyrisk": {"allergyrisk_1": 5},
+    }
+
+    localized = localize_payload(data, BLOCK)
+
+    assert [item["poll_title"] for item in localized["contamination"]] == [
+        "Artemisia (Artemisia)",
+        "Abedul (Betula)",
+        "alder (Alnus)",
+        "oak (Quercus)",
+        "lime",
+    ]
+    assert [item["contamination_1"] for item in localized["contamination"]] == [
+        1,
+        2,
+        3,
+        4,
+        0,
+    ]
+    assert localized["allergyrisk"] is data["allergyrisk"]
+    assert data["contamination"][0]["poll_title"] == "mugwort (Artemisia)"
+
+
+def test_localize_payload_without_latin_name() -> None:
+    """A title without any Latin name is just the localized name."""
+    data = {"contamination": [{"poll_id": 7, "poll_title": "mugwort"}]}
+
+    localized = localize_payload(data, BLOCK)
+
+    assert localized["contamination"][0]["poll_title"] == "Artemisia"